@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+from solutions import benchmark, cache, runner
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m solutions", description="Run Advent of Code solutions."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Solve the selected days in parallel.")
+    run.add_argument("--years", type=int, nargs="+", help="Years to run (default: all).")
+    run.add_argument("--days", type=int, nargs="+", help="Days to run (default: all).")
+    run.add_argument(
+        "--inputs",
+        type=Path,
+        default=runner.DEFAULT_INPUTS,
+        help="Directory holding yYYYY/day_DD.txt inputs (default: inputs/).",
+    )
+    run.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU core).",
+    )
+    run.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=cache.DEFAULT_CACHE_DIR,
+        help="Answer cache directory (default: .aoc_cache/, or $AOC_CACHE_DIR).",
+    )
+    run.add_argument("--no-cache", action="store_true", help="Always recompute answers.")
+
+    bench = commands.add_parser("bench", help="Time parse and both parts of the selected days.")
+    bench.add_argument("--years", type=int, nargs="+", help="Years to time (default: all).")
+    bench.add_argument("--days", type=int, nargs="+", help="Days to time (default: all).")
+    bench.add_argument(
+        "--inputs",
+        type=Path,
+        default=runner.DEFAULT_INPUTS,
+        help="Directory holding yYYYY/day_DD.txt inputs (default: inputs/).",
+    )
+    bench.add_argument("--samples", type=int, default=5, help="Samples per stage (default: 5).")
+    bench.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes; more than one trades timing stability for speed (default: 1).",
+    )
+    bench.add_argument(
+        "--history",
+        type=Path,
+        default=benchmark.DEFAULT_HISTORY,
+        help="JSON-lines timing history (default: benchmarks/history.jsonl).",
+    )
+    bench.add_argument(
+        "--compare",
+        action="store_true",
+        help="Fail when a stage median regresses against the recorded history.",
+    )
+    bench.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="Allowed slowdown ratio against the baseline median (default: 1.5).",
+    )
+    bench.add_argument(
+        "--min-time",
+        type=float,
+        default=0.005,
+        help="Ignore stages faster than this many seconds (default: 0.005).",
+    )
+    bench.add_argument(
+        "--no-save", action="store_true", help="Do not append this run to the history file."
+    )
+    return parser.parse_args(argv)
+
+
+def run_command(args: argparse.Namespace) -> int:
+    specs = runner.discover(args.years, args.days)
+    if not specs:
+        print("error: no matching solutions found", file=sys.stderr)
+        return 1
+
+    answer_cache = None if args.no_cache else cache.AnswerCache(args.cache_dir)
+    task = partial(runner.run_day, cache=answer_cache)
+    start = time.perf_counter()
+    results = runner.run_all(specs, args.inputs, args.workers, task=task)
+    wall = time.perf_counter() - start
+
+    print(runner.format_table(results))
+    solved = sum(1 for result in results if result.error is None)
+    busy = sum(result.elapsed for result in results)
+    print(f"\n{solved}/{len(results)} days solved in {wall:.3f}s wall ({busy:.3f}s solver time)")
+    return 0 if solved == len(results) else 1
+
+
+def bench_command(args: argparse.Namespace) -> int:
+    specs = runner.discover(args.years, args.days)
+    if not specs:
+        print("error: no matching solutions found", file=sys.stderr)
+        return 1
+    if args.samples < 1:
+        print("error: --samples must be at least 1", file=sys.stderr)
+        return 1
+
+    task = partial(benchmark.bench_day, samples=args.samples)
+    results = runner.run_all(specs, args.inputs, args.workers, task=task)
+    print(benchmark.format_report(results))
+
+    record = benchmark.make_record(results, args.samples)
+    if args.compare:
+        baseline = benchmark.baseline_from(benchmark.load_history(args.history))
+        regressions = benchmark.find_regressions(record, baseline, args.threshold, args.min_time)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression.key} {regression.stage}: "
+                f"{regression.baseline:.4f}s -> {regression.current:.4f}s "
+                f"(x{regression.ratio:.2f})"
+            )
+        if regressions:
+            # Keep the baseline intact so a regression cannot become the new normal.
+            return 1
+        print(f"\nNo regressions above x{args.threshold:.2f}.")
+
+    if not args.no_save and record["days"]:
+        benchmark.append_history(args.history, record)
+        print(f"Appended results to {args.history}")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.command == "run":
+        return run_command(args)
+    if args.command == "bench":
+        return bench_command(args)
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
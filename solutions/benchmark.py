@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import importlib
+import json
+import math
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+from solutions.runner import PARTS, DaySpec, parse_input, part_call, render_table
+
+DEFAULT_HISTORY = Path("benchmarks/history.jsonl")
+STAGES = ("parse", "part1", "part2")
+
+
+@dataclass
+class DayBenchmark:
+    spec: DaySpec
+    samples: dict[str, list[float]] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def key(self) -> str:
+        return day_key(self.spec)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {
+            stage: {"median": statistics.median(times), "p95": percentile(times, 95)}
+            for stage, times in self.samples.items()
+            if times
+        }
+
+
+@dataclass(frozen=True)
+class Regression:
+    key: str
+    stage: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else math.inf
+
+
+def day_key(spec: DaySpec) -> str:
+    return f"{spec.year}/{spec.day:02d}"
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def bench_day(spec: DaySpec, inputs_root: Path, samples: int = 5) -> DayBenchmark:
+    bench = DayBenchmark(spec, {stage: [] for stage in STAGES})
+    path = spec.input_path(inputs_root)
+    if not path.exists():
+        bench.error = f"missing input {path}"
+        return bench
+
+    try:
+        module = importlib.import_module(spec.module_name)
+        raw = path.read_text(encoding="utf-8")
+        calls = {part: part_call(spec, module, part) for part in PARTS}
+        for _ in range(samples):
+            for part, call in calls.items():
+                if call is None:
+                    continue
+                start = time.perf_counter()
+                parsed = parse_input(module, raw)
+                bench.samples["parse"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                call(module, parsed, raw)
+                bench.samples[f"part{part}"].append(time.perf_counter() - start)
+    except Exception as error:  # noqa: BLE001 - report and keep the batch going
+        bench.error = f"{type(error).__name__}: {error}"
+    return bench
+
+
+def make_record(benchmarks: Sequence[DayBenchmark], samples: int) -> dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "samples": samples,
+        "days": {bench.key: bench.summary() for bench in benchmarks if bench.error is None},
+        "errors": {bench.key: bench.error for bench in benchmarks if bench.error is not None},
+    }
+
+
+def load_history(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def append_history(path: Path, record: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def baseline_from(history: Sequence[dict[str, Any]]) -> dict[str, dict[str, dict[str, float]]]:
+    # Later records win, so a partial run only replaces the days it measured.
+    baseline: dict[str, dict[str, dict[str, float]]] = {}
+    for record in history:
+        baseline.update(record.get("days", {}))
+    return baseline
+
+
+def find_regressions(
+    record: dict[str, Any],
+    baseline: dict[str, dict[str, dict[str, float]]],
+    threshold: float = 1.5,
+    min_time: float = 0.005,
+) -> list[Regression]:
+    regressions: list[Regression] = []
+    for key, stages in sorted(record["days"].items()):
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for stage, stats in stages.items():
+            if stage not in previous:
+                continue
+            current = stats["median"]
+            reference = previous[stage]["median"]
+            if current < min_time:
+                continue  # Too fast to time reliably.
+            if current > max(reference, min_time) * threshold:
+                regressions.append(Regression(key, stage, reference, current))
+    return regressions
+
+
+def format_report(benchmarks: Sequence[DayBenchmark]) -> str:
+    header = ("Day", *(f"{stage} med/p95" for stage in STAGES))
+    rows = []
+    for bench in benchmarks:
+        if bench.error is not None:
+            rows.append((bench.key, bench.error, "", ""))
+            continue
+        summary = bench.summary()
+        cells = [
+            f"{summary[stage]['median']:.4f}/{summary[stage]['p95']:.4f}s" if stage in summary else "-"
+            for stage in STAGES
+        ]
+        rows.append((bench.key, *cells))
+    return render_table(header, rows)
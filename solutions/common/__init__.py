@@ -0,0 +1 @@
+"""Engines shared by several puzzle solutions."""
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator, Mapping, Sequence
+
+REGISTERS = "abcd"
+
+CPY, INC, DEC, JNZ, TGL, OUT = range(6)
+OPCODES = {"cpy": CPY, "inc": INC, "dec": DEC, "jnz": JNZ, "tgl": TGL, "out": OUT}
+ONE_ARGUMENT = {INC, DEC, TGL, OUT}
+
+# (opcode, x is register, x, y is register, y); x/y are register indices or immediates.
+Decoded = tuple[int, bool, int, bool, int]
+# A superinstruction returns the next pointer, or None when its guard fails.
+FastPath = Callable[[list[int]], "int | None"]
+
+
+def decode_operand(operand: str | None) -> tuple[bool, int]:
+    if operand is None:
+        return False, 0
+    if operand in REGISTERS:
+        return True, REGISTERS.index(operand)
+    return False, int(operand)
+
+
+def decode(program: Iterable[tuple[str, Sequence[str]]]) -> list[Decoded]:
+    decoded: list[Decoded] = []
+    for opcode, args in program:
+        if opcode not in OPCODES:
+            raise ValueError(f"Unknown opcode: {opcode}")
+        x_reg, x = decode_operand(args[0] if args else None)
+        y_reg, y = decode_operand(args[1] if len(args) > 1 else None)
+        decoded.append((OPCODES[opcode], x_reg, x, y_reg, y))
+    return decoded
+
+
+def toggled(instruction: Decoded) -> Decoded:
+    opcode, x_reg, x, y_reg, y = instruction
+    if opcode in ONE_ARGUMENT:
+        opcode = DEC if opcode == INC else INC
+    else:
+        opcode = CPY if opcode == JNZ else JNZ
+    return opcode, x_reg, x, y_reg, y
+
+
+def _add_loop(code: Sequence[Decoded], pc: int) -> FastPath | None:
+    # inc/dec A; dec C; jnz C -2 (either order of the first two) => A +/-= C; C = 0
+    if pc + 3 > len(code):
+        return None
+    first, second, jump = code[pc : pc + 3]
+    if jump[0] != JNZ or not jump[1] or jump[3] or jump[4] != -2:
+        return None
+    counter = jump[2]
+    for step, dec in ((first, second), (second, first)):
+        if dec[0] != DEC or not dec[1] or dec[2] != counter:
+            continue
+        if step[0] not in (INC, DEC) or not step[1] or step[2] == counter:
+            continue
+        target, sign, exit_pc = step[2], 1 if step[0] == INC else -1, pc + 3
+
+        def add(regs: list[int]) -> int | None:
+            count = regs[counter]
+            if count <= 0:
+                return None
+            regs[target] += sign * count
+            regs[counter] = 0
+            return exit_pc
+
+        return add
+    return None
+
+
+def _multiply_loop(code: Sequence[Decoded], pc: int) -> FastPath | None:
+    # cpy S C; <add loop A += C>; dec D; jnz D -5 => A += S * D; C = 0; D = 0
+    if pc + 6 > len(code):
+        return None
+    copy, dec, jump = code[pc], code[pc + 4], code[pc + 5]
+    if copy[0] != CPY or not copy[3] or _add_loop(code, pc + 1) is None:
+        return None
+    counter = copy[4]
+    if code[pc + 3][2] != counter:
+        return None
+    if dec[0] != DEC or not dec[1] or jump[0] != JNZ or not jump[1] or jump[3] or jump[4] != -5:
+        return None
+    outer = dec[2]
+    if jump[2] != outer:
+        return None
+    inner = code[pc + 1] if code[pc + 1][2] != counter else code[pc + 2]
+    target, sign = inner[2], 1 if inner[0] == INC else -1
+    source_reg, source = copy[1], copy[2]
+    if len({target, counter, outer}) != 3 or (source_reg and source in (target, counter, outer)):
+        return None
+    exit_pc = pc + 6
+
+    def multiply(regs: list[int]) -> int | None:
+        times = regs[outer]
+        amount = regs[source] if source_reg else source
+        if times <= 0 or amount <= 0:
+            return None
+        regs[target] += sign * amount * times
+        regs[counter] = 0
+        regs[outer] = 0
+        return exit_pc
+
+    return multiply
+
+
+PEEPHOLES = (_multiply_loop, _add_loop)
+LONGEST_PEEPHOLE = 6
+
+
+class Machine:
+    """Assembunny VM over pre-decoded instructions with O(1) add and multiply loops."""
+
+    def __init__(
+        self,
+        program: Iterable[tuple[str, Sequence[str]]],
+        initial: Mapping[str, int] | None = None,
+    ) -> None:
+        self.code = decode(program)
+        self.registers = [0] * len(REGISTERS)
+        for name, amount in (initial or {}).items():
+            self.registers[REGISTERS.index(name)] = amount
+        self.pc = 0
+        self.steps = 0
+        self.toggles = 0
+        self.fast: list[FastPath | None] = [None] * len(self.code)
+        self._recompile(range(len(self.code)))
+
+    def _recompile(self, indices: Iterable[int]) -> None:
+        for index in indices:
+            self.fast[index] = None
+            for peephole in PEEPHOLES:
+                fast = peephole(self.code, index)
+                if fast is not None:
+                    self.fast[index] = fast
+                    break
+
+    def toggle(self, index: int) -> None:
+        self.code[index] = toggled(self.code[index])
+        self.toggles += 1
+        # Only superinstructions whose window covers the toggled slot are stale.
+        self._recompile(range(max(0, index - LONGEST_PEEPHOLE + 1), index + 1))
+
+    @property
+    def halted(self) -> bool:
+        return not 0 <= self.pc < len(self.code)
+
+    def state(self) -> tuple[int, tuple[int, ...], int]:
+        return self.pc, tuple(self.registers), self.toggles
+
+    def register_map(self) -> dict[str, int]:
+        return dict(zip(REGISTERS, self.registers))
+
+    def outputs(self, max_steps: int | None = None) -> Iterator[int]:
+        """Execute until halt (or ``max_steps`` dispatches), yielding every ``out`` value."""
+        code, fast, regs = self.code, self.fast, self.registers
+        size = len(code)
+        pc = self.pc
+        budget = self.steps + max_steps if max_steps is not None else None
+        steps = self.steps
+        try:
+            while 0 <= pc < size:
+                if budget is not None and steps >= budget:
+                    break
+                steps += 1
+                shortcut = fast[pc]
+                if shortcut is not None:
+                    target = shortcut(regs)
+                    if target is not None:
+                        pc = target
+                        continue
+                opcode, x_reg, x, y_reg, y = code[pc]
+                if opcode == CPY:
+                    if y_reg:
+                        regs[y] = regs[x] if x_reg else x
+                    pc += 1
+                elif opcode == INC:
+                    if x_reg:
+                        regs[x] += 1
+                    pc += 1
+                elif opcode == DEC:
+                    if x_reg:
+                        regs[x] -= 1
+                    pc += 1
+                elif opcode == JNZ:
+                    if regs[x] if x_reg else x:
+                        pc += regs[y] if y_reg else y
+                    else:
+                        pc += 1
+                elif opcode == TGL:
+                    target = pc + (regs[x] if x_reg else x)
+                    if 0 <= target < size:
+                        self.toggle(target)
+                    pc += 1
+                else:
+                    signal = regs[x] if x_reg else x
+                    pc += 1
+                    self.pc, self.steps = pc, steps
+                    yield signal
+        finally:
+            self.pc, self.steps = pc, steps
+
+    def run(self, max_steps: int | None = None) -> dict[str, int]:
+        for _ in self.outputs(max_steps):
+            pass
+        return self.register_map()
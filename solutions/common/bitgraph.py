@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, Hashable, Iterable, Iterator, Mapping
+
+
+def bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitGraph:
+    """Undirected graph over interned node ids, with adjacency held as int bitmasks.
+
+    Neighbour lists are kept alongside the masks so that sparse graphs with tens of
+    thousands of nodes can be walked without scanning every wide mask bit by bit.
+    """
+
+    def __init__(self, names: Iterable[Hashable]) -> None:
+        self.names = list(names)
+        self.ids = {name: index for index, name in enumerate(self.names)}
+        self.neighbours: list[set[int]] = [set() for _ in self.names]
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[Hashable, Hashable]]) -> BitGraph:
+        edges = list(edges)
+        graph = cls(sorted({node for edge in edges for node in edge}))
+        for left, right in edges:
+            graph.connect(graph.ids[left], graph.ids[right])
+        return graph
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Mapping[Hashable, Iterable[Hashable]]) -> BitGraph:
+        """Build from a symmetric adjacency mapping such as ``{node: {neighbour, ...}}``."""
+        graph = cls(sorted(adjacency))
+        ids = graph.ids
+        for node, others in adjacency.items():
+            graph.neighbours[ids[node]] = {ids[other] for other in others} - {ids[node]}
+        return graph
+
+    def connect(self, a: int, b: int) -> None:
+        if a != b:
+            self.neighbours[a].add(b)
+            self.neighbours[b].add(a)
+            self.__dict__.pop("masks", None)
+
+    @cached_property
+    def masks(self) -> list[int]:
+        return [sum(1 << other for other in others) for others in self.neighbours]
+
+    def select(self, predicate: Callable[[Hashable], bool]) -> int:
+        return sum(1 << index for index, name in enumerate(self.names) if predicate(name))
+
+    def degeneracy_order(self) -> list[int]:
+        """Repeatedly remove a node of minimum remaining degree (bucketed, linear time)."""
+        degree = [len(others) for others in self.neighbours]
+        buckets: list[set[int]] = [set() for _ in range(max(degree, default=0) + 1)]
+        for node, value in enumerate(degree):
+            buckets[value].add(node)
+        removed = [False] * len(degree)
+        order: list[int] = []
+        low = 0
+        for _ in range(len(degree)):
+            low = max(low - 1, 0)
+            while not buckets[low]:
+                low += 1
+            node = buckets[low].pop()
+            removed[node] = True
+            order.append(node)
+            for other in self.neighbours[node]:
+                if not removed[other]:
+                    buckets[degree[other]].discard(other)
+                    degree[other] -= 1
+                    buckets[degree[other]].add(other)
+        return order
+
+    def count_triangles(self, within: int = -1) -> int:
+        """Triangles whose three corners all lie in the ``within`` node mask."""
+        masks = self.masks
+        # Each triangle is counted once, from its lowest node along its middle one.
+        above = [masks[node] & within & -(1 << (node + 1)) for node in range(len(masks))]
+        total = 0
+        for a, others in enumerate(self.neighbours):
+            if not within >> a & 1:
+                continue
+            mask = above[a]
+            for b in others:
+                if b > a and within >> b & 1:
+                    total += (mask & above[b]).bit_count()
+        return total
+
+    def maximum_clique(self) -> list[int]:
+        """Largest clique by pivoted Bron–Kerbosch, rooted at each node in degeneracy order.
+
+        A root only considers neighbours later in the order, re-indexed locally so every
+        candidate mask fits in a few machine words however large the graph is. Roots and
+        branches that cannot beat the best clique found so far are cut.
+        """
+        order = self.degeneracy_order()
+        position = [0] * len(order)
+        for index, node in enumerate(order):
+            position[node] = index
+
+        best: list[int] = []
+        for node in order:
+            others = self.neighbours[node]
+            later = [other for other in others if position[other] > position[node]]
+            if len(later) + 1 <= len(best):
+                continue
+            local = {other: index for index, other in enumerate(later)}
+            local.update((other, index) for index, other in enumerate(others - set(later), len(later)))
+            adjacency = [
+                sum(1 << local[other] for other in self.neighbours[member] if other in local)
+                for member in later
+            ]
+            candidates = (1 << len(later)) - 1
+            clique = _largest(adjacency, candidates, ((1 << len(local)) - 1) ^ candidates, len(best) - 1)
+            if clique is not None:
+                best = [node] + [later[index] for index in bits(clique)]
+        return best
+
+
+def _largest(adjacency: list[int], candidates: int, excluded: int, beat: int) -> int | None:
+    """Largest maximal clique within ``candidates`` of size above ``beat``, or None."""
+    best: int | None = None
+
+    def expand(clique: int, size: int, candidates: int, excluded: int) -> None:
+        nonlocal best, beat
+        if not candidates:
+            if not excluded and size > beat:
+                best, beat = clique, size
+            return
+        if size + candidates.bit_count() <= beat:
+            return
+        # Pivot on the candidate with the most candidate neighbours; members of
+        # ``excluded`` outside the root's later neighbours have no local adjacency.
+        pivot = max(bits(candidates), key=lambda member: (candidates & adjacency[member]).bit_count())
+        for member in bits(candidates & ~adjacency[pivot]):
+            bit = 1 << member
+            expand(clique | bit, size + 1, candidates & adjacency[member], excluded & adjacency[member])
+            candidates &= ~bit
+            excluded |= bit
+
+    expand(0, 0, candidates, excluded)
+    return best
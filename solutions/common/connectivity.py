@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from array import array
+from typing import Sequence
+
+Coordinate = tuple[int, int]
+
+
+class UnionFind:
+    """Disjoint sets over ``0..size-1`` in flat int arrays (union by size, path halving)."""
+
+    def __init__(self, size: int) -> None:
+        self.parent = array("i", range(size))
+        self.size = array("i", [1]) * size
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> int:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+
+
+def first_blocking_obstacle(
+    width: int,
+    height: int,
+    obstacles: Sequence[Coordinate],
+    start: Coordinate,
+    goal: Coordinate,
+) -> int | None:
+    """Index of the obstacle whose arrival first cuts ``start`` off from ``goal``.
+
+    Works backwards from the fully blocked grid: obstacles are lifted in reverse order
+    and each freed cell is merged with its free neighbours, so the first lift that
+    reconnects the two cells names the culprit. Returns None if they stay connected.
+    """
+    cells = width * height
+    blockers = array("i", [0]) * cells
+    for x, y in obstacles:
+        blockers[y * width + x] += 1
+
+    sets = UnionFind(cells)
+
+    def free(cell: int) -> None:
+        y, x = divmod(cell, width)
+        if x > 0 and not blockers[cell - 1]:
+            sets.union(cell, cell - 1)
+        if x + 1 < width and not blockers[cell + 1]:
+            sets.union(cell, cell + 1)
+        if y > 0 and not blockers[cell - width]:
+            sets.union(cell, cell - width)
+        if y + 1 < height and not blockers[cell + width]:
+            sets.union(cell, cell + width)
+
+    for cell in range(cells):
+        if not blockers[cell]:
+            free(cell)
+
+    source = start[1] * width + start[0]
+    target = goal[1] * width + goal[0]
+
+    def connected() -> bool:
+        return not blockers[source] and not blockers[target] and sets.find(source) == sets.find(target)
+
+    if connected():
+        return None
+    for index in range(len(obstacles) - 1, -1, -1):
+        x, y = obstacles[index]
+        cell = y * width + x
+        blockers[cell] -= 1
+        if blockers[cell]:
+            continue  # Another copy of this obstacle is still in place.
+        free(cell)
+        if connected():
+            return index
+    return None
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+UNREACHED = 1 << 62
+
+# Maps a state id to its outgoing (state id, weight) edges; weights are 1..max_weight.
+Neighbours = Callable[[int], Iterable[tuple[int, int]]]
+
+
+def shortest_costs(
+    state_count: int,
+    sources: Iterable[int],
+    neighbours: Neighbours,
+    max_weight: int,
+    targets: Iterable[int] = (),
+    bound: int | None = None,
+) -> list[int]:
+    """Dial's algorithm: cheapest cost from any source to every state id below ``state_count``.
+
+    Costs come out of a ring of ``max_weight + 1`` buckets, so there is no heap. Once a
+    target settles (or from the start, if ``bound`` is given) nothing costlier than that
+    bound is expanded; states beyond it are left at ``UNREACHED``.
+    """
+    dist = [UNREACHED] * state_count
+    ring = max_weight + 1
+    buckets: list[list[int]] = [[] for _ in range(ring)]
+    pending = 0
+    for source in sources:
+        if dist[source] != 0:
+            dist[source] = 0
+            buckets[0].append(source)
+            pending += 1
+    goals = set(targets)
+
+    cost = 0
+    while pending and (bound is None or cost <= bound):
+        bucket = buckets[cost % ring]
+        while bucket:
+            state = bucket.pop()
+            pending -= 1
+            if dist[state] != cost:
+                continue  # Superseded by a cheaper entry that was expanded earlier.
+            if bound is None and state in goals:
+                bound = cost
+            for following, weight in neighbours(state):
+                new_cost = cost + weight
+                if new_cost < dist[following] and (bound is None or new_cost <= bound):
+                    dist[following] = new_cost
+                    buckets[new_cost % ring].append(following)
+                    pending += 1
+        cost += 1
+    return dist
+
+
+def bidirectional_costs(
+    state_count: int,
+    sources: Iterable[int],
+    targets: Iterable[int],
+    forward: Neighbours,
+    backward: Neighbours,
+    max_weight: int,
+) -> tuple[int, list[int], list[int]]:
+    """Return ``(best, from_sources, to_targets)``; a state lies on some cheapest route
+    exactly when ``from_sources[state] + to_targets[state] == best``.
+
+    Both searches stop expanding at ``best``, so neither explores the whole graph.
+    """
+    targets = list(targets)
+    from_sources = shortest_costs(state_count, sources, forward, max_weight, targets=targets)
+    best = min((from_sources[target] for target in targets), default=UNREACHED)
+    if best == UNREACHED:
+        return best, from_sources, [UNREACHED] * state_count
+    to_targets = shortest_costs(state_count, targets, backward, max_weight, bound=best)
+    return best, from_sources, to_targets
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Sequence
+
+SND, SET, ADD, SUB, MUL, MOD, RCV, JGZ, JNZ = range(9)
+OPCODES = {
+    "snd": SND,
+    "set": SET,
+    "add": ADD,
+    "sub": SUB,
+    "mul": MUL,
+    "mod": MOD,
+    "rcv": RCV,
+    "jgz": JGZ,
+    "jnz": JNZ,
+}
+REGISTER_COUNT = 26
+
+# (opcode, x is register, x, y is register, y); registers are indices into a 26-slot list.
+Decoded = tuple[int, bool, int, bool, int]
+
+
+def decode_operand(operand: str | None) -> tuple[bool, int]:
+    if operand is None:
+        return False, 0
+    if len(operand) == 1 and operand.isalpha():
+        return True, ord(operand) - ord("a")
+    return False, int(operand)
+
+
+def decode(program: Iterable[tuple[str, Sequence[str]]]) -> list[Decoded]:
+    decoded: list[Decoded] = []
+    for opcode, args in program:
+        if opcode not in OPCODES:
+            raise ValueError(f"Unknown opcode: {opcode}")
+        x_reg, x = decode_operand(args[0] if args else None)
+        y_reg, y = decode_operand(args[1] if len(args) > 1 else None)
+        decoded.append((OPCODES[opcode], x_reg, x, y_reg, y))
+    return decoded
+
+
+class Program:
+    """One duet process: runs until it halts or blocks on ``rcv`` with an empty inbox.
+
+    With ``sound=True`` the part 1 semantics apply instead: ``snd`` plays a sound
+    and the first ``rcv`` with a non-zero operand halts, recovering that sound.
+    """
+
+    def __init__(self, code: Sequence[Decoded], pid: int = 0, sound: bool = False) -> None:
+        self.code = code
+        self.pid = pid
+        self.sound = sound
+        self.registers = [0] * REGISTER_COUNT
+        self.registers[ord("p") - ord("a")] = pid
+        self.pc = 0
+        self.inbox: deque[int] = deque()
+        self.outbox: list[int] = []
+        self.sent = 0
+        self.mul_count = 0
+        self.last_sound = 0
+        self.recovered: int | None = None
+
+    @property
+    def halted(self) -> bool:
+        return self.recovered is not None or not 0 <= self.pc < len(self.code)
+
+    def register_map(self) -> dict[str, int]:
+        used = {x for _, x_reg, x, _, _ in self.code if x_reg}
+        used |= {y for _, _, _, y_reg, y in self.code if y_reg}
+        return {chr(ord("a") + index): self.registers[index] for index in sorted(used)}
+
+    def run(self) -> int:
+        """Execute until halt or an empty-inbox ``rcv``; return the instructions executed."""
+        if self.recovered is not None:
+            return 0
+        code, regs, inbox, outbox = self.code, self.registers, self.inbox, self.outbox
+        size = len(code)
+        pc = self.pc
+        executed = 0
+        muls = 0
+        sends = 0
+        while 0 <= pc < size:
+            opcode, x_reg, x, y_reg, y = code[pc]
+            if opcode == SET:
+                regs[x] = regs[y] if y_reg else y
+            elif opcode == ADD:
+                regs[x] += regs[y] if y_reg else y
+            elif opcode == SUB:
+                regs[x] -= regs[y] if y_reg else y
+            elif opcode == MUL:
+                regs[x] *= regs[y] if y_reg else y
+                muls += 1
+            elif opcode == MOD:
+                regs[x] %= regs[y] if y_reg else y
+            elif opcode == JGZ:
+                if (regs[x] if x_reg else x) > 0:
+                    pc += regs[y] if y_reg else y
+                    executed += 1
+                    continue
+            elif opcode == JNZ:
+                if regs[x] if x_reg else x:
+                    pc += regs[y] if y_reg else y
+                    executed += 1
+                    continue
+            elif opcode == SND:
+                if self.sound:
+                    self.last_sound = regs[x] if x_reg else x
+                else:
+                    outbox.append(regs[x] if x_reg else x)
+                    sends += 1
+            elif self.sound:
+                if regs[x] if x_reg else x:
+                    self.recovered = self.last_sound
+                    executed += 1
+                    break
+            elif inbox:
+                regs[x] = inbox.popleft()
+            else:
+                break
+            pc += 1
+            executed += 1
+        self.pc = pc
+        self.sent += sends
+        self.mul_count += muls
+        return executed
+
+
+def run_network(programs: Sequence[Program]) -> bool:
+    """Run a ring of programs to quiescence; return True if it ended in deadlock.
+
+    Each program runs until it blocks, then its outbox is handed to the next program
+    in the ring as one batch. A round in which nothing executes ends the run.
+    """
+    count = len(programs)
+    while True:
+        progressed = False
+        for index, program in enumerate(programs):
+            if program.halted:
+                continue
+            if program.run():
+                progressed = True
+            if program.outbox:
+                programs[(index + 1) % count].inbox.extend(program.outbox)
+                program.outbox.clear()
+        if not progressed:
+            return any(not program.halted for program in programs)
@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import functools
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, NamedTuple, Sequence
+
+Instruction = tuple[str, int, int, int]
+
+# Value expressions per opcode. ``{A}``/``{B}`` read registers, ``{a}``/``{b}`` are immediates.
+EXPRESSIONS: dict[str, str] = {
+    "addr": "{A} + {B}",
+    "addi": "{A} + {b}",
+    "mulr": "{A} * {B}",
+    "muli": "{A} * {b}",
+    "banr": "{A} & {B}",
+    "bani": "{A} & {b}",
+    "borr": "{A} | {B}",
+    "bori": "{A} | {b}",
+    "setr": "{A}",
+    "seti": "{a}",
+    "gtir": "(1 if {a} > {B} else 0)",
+    "gtri": "(1 if {A} > {b} else 0)",
+    "gtrr": "(1 if {A} > {B} else 0)",
+    "eqir": "(1 if {a} == {B} else 0)",
+    "eqri": "(1 if {A} == {b} else 0)",
+    "eqrr": "(1 if {A} == {B} else 0)",
+}
+
+OPCODES: tuple[str, ...] = tuple(EXPRESSIONS)
+
+OPERATIONS: dict[str, Callable[[Sequence[int], int, int], int]] = {
+    "addr": lambda r, a, b: r[a] + r[b],
+    "addi": lambda r, a, b: r[a] + b,
+    "mulr": lambda r, a, b: r[a] * r[b],
+    "muli": lambda r, a, b: r[a] * b,
+    "banr": lambda r, a, b: r[a] & r[b],
+    "bani": lambda r, a, b: r[a] & b,
+    "borr": lambda r, a, b: r[a] | r[b],
+    "bori": lambda r, a, b: r[a] | b,
+    "setr": lambda r, a, b: r[a],
+    "seti": lambda r, a, b: a,
+    "gtir": lambda r, a, b: 1 if a > r[b] else 0,
+    "gtri": lambda r, a, b: 1 if r[a] > b else 0,
+    "gtrr": lambda r, a, b: 1 if r[a] > r[b] else 0,
+    "eqir": lambda r, a, b: 1 if a == r[b] else 0,
+    "eqri": lambda r, a, b: 1 if r[a] == b else 0,
+    "eqrr": lambda r, a, b: 1 if r[a] == r[b] else 0,
+}
+
+
+def apply(registers: Sequence[int], name: str, a: int, b: int, c: int) -> list[int]:
+    result = list(registers)
+    result[c] = OPERATIONS[name](registers, a, b)
+    return result
+
+
+def divisor_sum(number: int, minimum: int = 1) -> int:
+    total = 0
+    for value in range(1, math.isqrt(number) + 1):
+        if number % value == 0:
+            partner = number // value
+            if value >= minimum:
+                total += value
+            if partner != value and partner >= minimum:
+                total += partner
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Idioms: hot loops recognised in the instruction stream and replaced by arithmetic.
+# Each matcher returns guarded replacement code for the loop head, or None.
+
+
+def _is(instruction: Instruction, name: str, *operands: int | None) -> bool:
+    if instruction[0] != name:
+        return False
+    return all(want is None or want == got for want, got in zip(operands, instruction[1:]))
+
+
+def _jump_on(instruction: Instruction, ip_bind: int) -> int | None:
+    """Return the flag register of an ``addr flag ip ip`` skip, in either operand order."""
+    name, a, b, c = instruction
+    if name != "addr" or c != ip_bind:
+        return None
+    if a == ip_bind and b != ip_bind:
+        return b
+    if b == ip_bind and a != ip_bind:
+        return a
+    return None
+
+
+def _distinct(*registers: int) -> bool:
+    return len(set(registers)) == len(registers)
+
+
+class _Divisors(NamedTuple):
+    x: int
+    y: int
+    n: int
+    acc: int
+    eq_flag: int
+    gt_flag: int
+
+
+def _match_divisor_inner(
+    program: Sequence[Instruction], head: int, ip_bind: int
+) -> _Divisors | None:
+    # head:   mulr X Y T     head+5: addi Y 1 Y
+    # head+1: eqrr T N T     head+6: gtrr Y N G
+    # head+2: addr T ip ip   head+7: addr ip G ip
+    # head+3: addi ip 1 ip   head+8: seti head-1 _ ip
+    # head+4: addr X A A
+    if head + 9 > len(program):
+        return None
+    mul, eq, skip, step, add, inc, cmp, leave, back = program[head : head + 9]
+    if mul[0] != "mulr" or eq[0] != "eqrr":
+        return None
+    t = mul[3]
+    if eq[3] != t or t not in (eq[1], eq[2]):
+        return None
+    n = eq[2] if eq[1] == t else eq[1]
+    if _jump_on(skip, ip_bind) != t or not _is(step, "addi", ip_bind, 1, ip_bind):
+        return None
+    if inc[0] != "addi" or inc[1] != inc[3] or inc[2] != 1 or inc[3] not in (mul[1], mul[2]):
+        return None
+    y = inc[3]
+    x = mul[2] if mul[1] == y else mul[1]
+    if add[0] != "addr" or add[3] not in (add[1], add[2]) or x not in (add[1], add[2]):
+        return None
+    acc = add[3]
+    if not _is(cmp, "gtrr", y, n):
+        return None
+    g = cmp[3]
+    if _jump_on(leave, ip_bind) != g or not _is(back, "seti", head - 1, None, ip_bind):
+        return None
+    if not _distinct(x, y, n, acc, t, ip_bind) or g in (x, y, n, acc, ip_bind):
+        return None
+    return _Divisors(x, y, n, acc, t, g)
+
+
+def _divisor_inner_code(
+    program: Sequence[Instruction], head: int, ip_bind: int
+) -> list[str] | None:
+    match = _match_divisor_inner(program, head, ip_bind)
+    if match is None:
+        return None
+    x, y, n, acc, t, g = (f"r{reg}" for reg in match)
+    # Do-while over Y in [Y0, max(Y0, N)], adding X whenever X * Y == N.
+    return [
+        f"last = {n} if {n} > {y} else {y}",
+        f"if {x} and {n} % {x} == 0 and {y} <= {n} // {x} <= last:",
+        f"    {acc} += {x}",
+        f"steps += 8 * (last - {y} + 1) - 1",
+        f"{t} = 1 if {x} * last == {n} else 0",
+        f"{y} = last + 1",
+        f"{g} = 1",
+        f"ip = {head + 9}",
+        "continue",
+    ]
+
+
+def _divisor_outer_code(
+    program: Sequence[Instruction], head: int, ip_bind: int
+) -> list[str] | None:
+    # head:    seti 1 _ Y             head+10: addi X 1 X
+    # head+1:  <divisor inner loop>   head+11: gtrr X N H
+    #                                 head+12: addr H ip ip
+    #                                 head+13: seti head-1 _ ip
+    if head + 14 > len(program):
+        return None
+    inner = _match_divisor_inner(program, head + 1, ip_bind)
+    if inner is None or not _is(program[head], "seti", 1, None, inner.y):
+        return None
+    inc, cmp, leave, back = program[head + 10 : head + 14]
+    if not _is(inc, "addi", inner.x, 1, inner.x) or not _is(cmp, "gtrr", inner.x, inner.n):
+        return None
+    h = cmp[3]
+    if _jump_on(leave, ip_bind) != h or not _is(back, "seti", head - 1, None, ip_bind):
+        return None
+    if h in (inner.x, inner.y, inner.n, inner.acc, ip_bind):
+        return None
+    x, y, n, acc, t, g = (f"r{reg}" for reg in inner)
+    # For X in [X0, max(X0, N)] the inner loop adds X exactly when X divides N.
+    return [
+        f"if {x} >= 1 and {n} >= 1:",
+        f"    last = {n} if {n} > {x} else {x}",
+        f"    {acc} += divisor_sum({n}, {x})",
+        f"    steps += (last - {x} + 1) * (8 * {n} + 4) - 1",
+        f"    {x} = last + 1",
+        f"    {y} = {n} + 1",
+        f"    {t} = 1 if last == 1 else 0",
+        f"    {g} = 1",
+        f"    r{h} = 1",
+        f"    ip = {head + 14}",
+        "    continue",
+    ]
+
+
+def _floor_divide_code(
+    program: Sequence[Instruction], head: int, ip_bind: int
+) -> list[str] | None:
+    # head:   addi T 1 U       head+4: addi ip 1 ip
+    # head+1: muli U K U       head+5: seti E _ ip
+    # head+2: gtrr U R U       head+6: addi T 1 T
+    # head+3: addr U ip ip     head+7: seti head-1 _ ip
+    if head + 8 > len(program):
+        return None
+    start, scale, cmp, skip, step, leave, inc, back = program[head : head + 8]
+    if start[0] != "addi" or start[2] != 1:
+        return None
+    t, u = start[1], start[3]
+    if not _is(scale, "muli", u, None, u) or scale[2] <= 0:
+        return None
+    k = scale[2]
+    if cmp[0] != "gtrr" or cmp[1] != u or cmp[3] != u:
+        return None
+    r = cmp[2]
+    if _jump_on(skip, ip_bind) != u or not _is(step, "addi", ip_bind, 1, ip_bind):
+        return None
+    if not _is(leave, "seti", None, None, ip_bind) or not _is(inc, "addi", t, 1, t):
+        return None
+    if not _is(back, "seti", head - 1, None, ip_bind) or not _distinct(t, u, r, ip_bind):
+        return None
+    exit_ip = leave[1] + 1
+    # Smallest T >= T0 with (T + 1) * K > R.
+    return [
+        f"quotient = r{r} // {k}",
+        f"if quotient > r{t}:",
+        f"    steps += 7 * (quotient - r{t})",
+        f"    r{t} = quotient",
+        f"r{u} = 1",
+        "steps += 5",
+        f"ip = {exit_ip}",
+        "continue",
+    ]
+
+
+# (instructions covered, matcher); the first match at a loop head wins.
+IDIOMS: tuple[tuple[int, Callable[[Sequence[Instruction], int, int], list[str] | None]], ...] = (
+    (14, _divisor_outer_code),
+    (9, _divisor_inner_code),
+    (8, _floor_divide_code),
+)
+
+
+# ---------------------------------------------------------------------------
+# Compiler: every instruction index gets a straight-line entry running up to the next
+# jump (any write to the bound ip register); entries are picked by a binary if-tree.
+
+RunFunction = Callable[[list[int], int, float], tuple[int, int]]
+
+
+def _operand(register: int, index: int, ip_bind: int | None) -> str:
+    return str(index) if register == ip_bind else f"r{register}"
+
+
+def _expression(instruction: Instruction, index: int, ip_bind: int | None) -> str:
+    name, a, b, _ = instruction
+    return EXPRESSIONS[name].format(
+        A=_operand(a, index, ip_bind), B=_operand(b, index, ip_bind), a=a, b=b
+    )
+
+
+def _entry(
+    program: Sequence[Instruction],
+    start: int,
+    ip_bind: int | None,
+    breakpoints: frozenset[int],
+    idioms: bool,
+) -> list[str]:
+    lines: list[str] = []
+    if idioms and ip_bind is not None:
+        for span, idiom in IDIOMS:
+            if not breakpoints.isdisjoint(range(start + 1, start + span)):
+                continue
+            code = idiom(program, start, ip_bind)
+            if code is not None:
+                # Guarded idioms fall through to the plain code when their guard fails.
+                lines.extend(code)
+                break
+
+    for index in range(start, len(program)):
+        if index > start and index in breakpoints:
+            lines += [f"steps += {index - start}", f"ip = {index}", "continue"]
+            return lines
+        instruction = program[index]
+        expression = _expression(instruction, index, ip_bind)
+        if instruction[3] == ip_bind:
+            lines += [f"steps += {index - start + 1}", f"ip = ({expression}) + 1", "continue"]
+            return lines
+        lines.append(f"r{instruction[3]} = {expression}")
+    lines += [f"steps += {len(program) - start}", f"ip = {len(program)}", "continue"]
+    return lines
+
+
+def _dispatch(entries: list[list[str]], lo: int, hi: int, indent: str) -> list[str]:
+    if hi - lo == 1:
+        return [indent + line for line in entries[lo]]
+    mid = (lo + hi) // 2
+    return [
+        f"{indent}if ip < {mid}:",
+        *_dispatch(entries, lo, mid, indent + "    "),
+        f"{indent}else:",
+        *_dispatch(entries, mid, hi, indent + "    "),
+    ]
+
+
+@functools.lru_cache(maxsize=32)
+def compile_program(
+    program: tuple[Instruction, ...],
+    ip_bind: int | None,
+    register_count: int = 6,
+    breakpoints: frozenset[int] = frozenset(),
+    idioms: bool = True,
+) -> RunFunction:
+    """Compile ``program`` into ``run(registers, ip, limit) -> (ip, steps)``.
+
+    ``run`` updates ``registers`` in place and returns once the program halts, ``limit``
+    instructions have executed (checked between entries) or execution reaches one of
+    ``breakpoints`` other than the starting ``ip``.
+    """
+    names = ", ".join(f"r{index}" for index in range(register_count))
+    length = len(program)
+    entries = [_entry(program, start, ip_bind, breakpoints, idioms) for start in range(length)]
+    lines = [
+        "def run(registers, ip, limit):",
+        f"    {names}, = registers",
+        "    steps = 0",
+        "    resumed = True",
+        f"    while 0 <= ip < {length} and steps < limit:",
+        "        if ip in breakpoints and not resumed:",
+        "            break",
+        "        resumed = False",
+        *_dispatch(entries, 0, length, " " * 8),
+        "    if steps:",
+        f"        registers[:] = [{names}]",
+    ]
+    if ip_bind is not None:
+        # Between instructions the bound register holds the last value written to it.
+        lines.append(f"        registers[{ip_bind}] = ip - 1")
+    lines.append("    return ip, steps")
+    source = "\n".join(lines) + "\n"
+    namespace: dict[str, object] = {"breakpoints": breakpoints, "divisor_sum": divisor_sum}
+    exec(compile(source, f"<elfcode:{length}>", "exec"), namespace)
+    return namespace["run"]  # type: ignore[return-value]
+
+
+class TraceEntry(NamedTuple):
+    ip: int
+    instruction: Instruction
+    registers: tuple[int, ...]
+
+
+@dataclass
+class Machine:
+    program: tuple[Instruction, ...]
+    ip_bind: int | None = None
+    registers: list[int] = field(default_factory=lambda: [0] * 6)
+    ip: int = 0
+    steps: int = 0
+
+    @property
+    def halted(self) -> bool:
+        return not 0 <= self.ip < len(self.program)
+
+    def step(self) -> Instruction:
+        """Interpret a single instruction; the reference semantics for ``run``."""
+        instruction = self.program[self.ip]
+        if self.ip_bind is not None:
+            self.registers[self.ip_bind] = self.ip
+        name, a, b, c = instruction
+        self.registers[c] = OPERATIONS[name](self.registers, a, b)
+        self.ip = self.registers[self.ip_bind] + 1 if self.ip_bind is not None else self.ip + 1
+        self.steps += 1
+        return instruction
+
+    def trace(self, limit: int | None = None) -> Iterator[TraceEntry]:
+        executed = 0
+        while not self.halted and (limit is None or executed < limit):
+            ip = self.ip
+            instruction = self.step()
+            executed += 1
+            yield TraceEntry(ip, instruction, tuple(self.registers))
+
+    def run(
+        self,
+        limit: int | None = None,
+        breakpoints: Sequence[int] = (),
+        idioms: bool = True,
+    ) -> int:
+        """Run compiled code until halt, ``limit`` steps or a breakpoint; return the ip.
+
+        A ``limit`` is exact: idioms are skipped, plain entries (never longer than the
+        program) run until they might cross it, and the rest is interpreted one step
+        at a time.
+        """
+        stops = frozenset(breakpoints)
+        if limit is None:
+            run = compile_program(self.program, self.ip_bind, len(self.registers), stops, idioms)
+            self.ip, steps = run(self.registers, self.ip, math.inf)
+            self.steps += steps
+            return self.ip
+
+        run = compile_program(self.program, self.ip_bind, len(self.registers), stops, False)
+        self.ip, executed = run(self.registers, self.ip, limit - len(self.program))
+        self.steps += executed
+        while executed < limit and not self.halted and not (executed and self.ip in stops):
+            self.step()
+            executed += 1
+        return self.ip
+
+    def values_at(self, ip: int, register: int) -> Iterator[int]:
+        """Yield ``register`` every time execution reaches instruction ``ip``."""
+        if self.ip == ip:
+            yield self.registers[register]
+        while self.run(breakpoints=(ip,)) == ip:
+            yield self.registers[register]
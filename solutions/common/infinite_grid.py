@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+BORDER = 0xFF
+
+
+class InfiniteGrid:
+    """Unbounded 2-D byte grid stored row-major in one ``bytearray``.
+
+    The live area is wrapped in a one-cell ring of ``BORDER`` bytes, so a walker that
+    reads its cell anyway learns for free when it has stepped outside and must call
+    ``grow``. Growing doubles both dimensions and keeps the old area centred.
+    """
+
+    def __init__(self, min_x: int, min_y: int, width: int, height: int, fill: int = 0) -> None:
+        if fill == BORDER:
+            raise ValueError(f"Fill value {BORDER} is reserved for the border")
+        self.fill = fill
+        self._allocate(min_x, min_y, max(1, width), max(1, height))
+
+    def _allocate(self, min_x: int, min_y: int, width: int, height: int) -> None:
+        self.min_x, self.min_y = min_x, min_y
+        self.width, self.height = width, height
+        self.stride = width + 2
+        row = bytes([BORDER]) + bytes([self.fill]) * width + bytes([BORDER])
+        self.cells = bytearray([BORDER]) * self.stride + row * height + bytearray([BORDER]) * self.stride
+
+    @classmethod
+    def from_points(cls, points: Iterable[tuple[tuple[int, int], int]], fill: int = 0) -> InfiniteGrid:
+        points = list(points)
+        xs = [x for (x, _), _ in points] or [0]
+        ys = [y for (_, y), _ in points] or [0]
+        min_x, min_y = min(min(xs), 0), min(min(ys), 0)
+        grid = cls(min_x, min_y, max(max(xs), 0) - min_x + 1, max(max(ys), 0) - min_y + 1, fill)
+        for (x, y), value in points:
+            grid[x, y] = value
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        return (y - self.min_y + 1) * self.stride + (x - self.min_x + 1)
+
+    def coords(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, self.stride)
+        return col - 1 + self.min_x, row - 1 + self.min_y
+
+    def moves(self) -> tuple[int, int, int, int]:
+        """Index offsets for up, right, down and left; they change whenever the grid grows."""
+        return -self.stride, 1, self.stride, -1
+
+    def __getitem__(self, point: tuple[int, int]) -> int:
+        x, y = point
+        if self.min_x <= x < self.min_x + self.width and self.min_y <= y < self.min_y + self.height:
+            return self.cells[self.index(x, y)]
+        return self.fill
+
+    def __setitem__(self, point: tuple[int, int], value: int) -> None:
+        x, y = point
+        while not (self.min_x <= x < self.min_x + self.width and self.min_y <= y < self.min_y + self.height):
+            self.grow()
+        self.cells[self.index(x, y)] = value
+
+    def grow(self, index: int | None = None) -> int | None:
+        """Double the grid in place; return ``index`` translated to the new layout."""
+        point = self.coords(index) if index is not None else None
+        old_cells, old_stride = self.cells, self.stride
+        old_min_x, old_min_y, width, height = self.min_x, self.min_y, self.width, self.height
+        self._allocate(
+            old_min_x - (width + 1) // 2, old_min_y - (height + 1) // 2, 2 * width, 2 * height
+        )
+        for row in range(height):
+            source = (row + 1) * old_stride + 1
+            target = self.index(old_min_x, old_min_y + row)
+            self.cells[target : target + width] = old_cells[source : source + width]
+        return self.index(*point) if point is not None else None
+
+    def count(self, value: int) -> int:
+        return self.cells.count(value)
+
+    def __iter__(self) -> Iterator[tuple[tuple[int, int], int]]:
+        for y in range(self.min_y, self.min_y + self.height):
+            start = self.index(self.min_x, y)
+            for offset, value in enumerate(self.cells[start : start + self.width]):
+                yield (self.min_x + offset, y), value
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from typing import Sequence
+
+# SWAR over Python ints: many small values sit side by side in 64-bit lanes of one big
+# int, so a single shift, mask, add or small multiply updates every lane at C speed.
+# Callers must keep each lane's intermediate results below 2**64.
+LANE_TYPE = "Q"
+LANE_BYTES = array(LANE_TYPE).itemsize
+
+
+@lru_cache(maxsize=None)
+def lane_constant(value: int, lanes: int) -> int:
+    return int.from_bytes(array(LANE_TYPE, [value]).tobytes() * lanes, "little")
+
+
+def pack(values: Sequence[int]) -> int:
+    return int.from_bytes(array(LANE_TYPE, values).tobytes(), "little")
+
+
+def unpack(block: int, lanes: int) -> array:
+    return array(LANE_TYPE, to_bytes(block, lanes))
+
+
+def to_bytes(block: int, lanes: int) -> bytes:
+    return block.to_bytes(lanes * LANE_BYTES, "little")
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+from contextlib import closing
+from typing import Any, Iterator
+
+from solutions.common import parallel
+
+Hit = tuple[int, bytes]
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+@functools.lru_cache(maxsize=64)
+def prefix_hasher(prefix: str) -> Any:
+    # Callers must only ever .copy() the returned object.
+    return hashlib.md5(prefix.encode("utf-8"))
+
+
+def md5_digest(prefix: str, suffix: str) -> bytes:
+    hasher = prefix_hasher(prefix).copy()
+    hasher.update(suffix.encode("utf-8"))
+    return hasher.digest()
+
+
+def nibble(digest: bytes, position: int) -> int:
+    byte = digest[position >> 1]
+    return byte & 0x0F if position & 1 else byte >> 4
+
+
+def scan_chunk(secret: str, zeros: int, start: int, stop: int) -> list[Hit]:
+    base = hashlib.md5(secret.encode("utf-8"))
+    full, half = divmod(zeros, 2)
+    empty = bytes(full)
+    hits: list[Hit] = []
+    for index in range(start, stop):
+        hasher = base.copy()
+        hasher.update(str(index).encode("ascii"))
+        digest = hasher.digest()
+        if digest[:full] == empty and (not half or digest[full] < 0x10):
+            hits.append((index, digest))
+    return hits
+
+
+def mine(
+    secret: str,
+    zeros: int,
+    start: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+) -> Iterator[Hit]:
+    """Yield ``(index, digest)`` for every index whose MD5 has ``zeros`` leading hex zeros.
+
+    Hits come out in increasing index order however many worker processes share
+    the search, so "lowest index" and "first N hits" stay exact.
+    """
+    chunks = parallel.ordered_chunks(scan_chunk, (secret, zeros), start, chunk_size, workers)
+    with closing(chunks):
+        for hits in chunks:
+            yield from hits
+
+
+def first_hit(
+    secret: str,
+    zeros: int,
+    start: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+) -> Hit:
+    with closing(mine(secret, zeros, start, chunk_size, workers)) as hits:
+        return next(hits)
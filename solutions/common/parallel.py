@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import count
+from typing import Any, Callable, Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+
+def ordered_chunks(
+    func: Callable[..., T],
+    args: tuple[Any, ...],
+    start: int,
+    chunk_size: int,
+    workers: int | None = None,
+) -> Iterator[T]:
+    """Yield ``func(*args, lo, hi)`` for consecutive ``[lo, hi)`` chunks from ``start`` onwards.
+
+    Chunks are farmed out to a process pool a few at a time and yielded strictly in
+    index order. The stream is unbounded; close the generator to stop the workers.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_starts = count(start, chunk_size)
+    if workers == 1:
+        for lo in chunk_starts:
+            yield func(*args, lo, lo + chunk_size)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending: deque[Future[T]] = deque()
+    try:
+        while True:
+            while len(pending) < 2 * workers:
+                lo = next(chunk_starts)
+                pending.append(pool.submit(func, *args, lo, lo + chunk_size))
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def map_chunks(
+    func: Callable[[Sequence[S]], T],
+    items: Sequence[S],
+    chunk_size: int,
+    workers: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[T]:
+    """Yield ``func(chunk)`` for consecutive ``chunk_size`` slices of ``items``, in order.
+
+    Each task ships only its own slice. Shared read-only state should be built once per
+    worker by ``initializer``; with a single worker it runs in this process instead.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = (items[lo : lo + chunk_size] for lo in range(0, len(items), chunk_size))
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(func, chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        yield from pool.map(func, chunks)
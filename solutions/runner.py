@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import importlib
+import inspect
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Sequence, TypeVar
+
+from solutions.cache import AnswerCache
+
+PACKAGE_ROOT = Path(__file__).resolve().parent
+DEFAULT_INPUTS = Path("inputs")
+PARTS = (1, 2)
+
+_DAY_FILE = re.compile(r"day_(\d{2})\.py")
+
+T = TypeVar("T")
+PartCall = Callable[[ModuleType, Any, str], Any]
+
+# Days whose solvers do not follow the plain ``solve_partN(parse(raw))`` shape.
+CALL_OVERRIDES: dict[tuple[int, int, int], PartCall] = {
+    (2017, 10, 2): lambda module, parsed, raw: module.solve_part2(parsed, raw=raw),
+    (2024, 14, 1): lambda module, parsed, raw: module.solve_part1(parsed, 101, 103),
+    (2024, 14, 2): lambda module, parsed, raw: module.solve_part2(parsed, 101, 103)[0],
+    (2025, 5, 2): lambda module, parsed, raw: module.solve_part2(parsed[0]),
+}
+
+
+@dataclass(frozen=True, order=True)
+class DaySpec:
+    year: int
+    day: int
+
+    @property
+    def module_name(self) -> str:
+        return f"solutions.y{self.year}.day_{self.day:02d}"
+
+    def input_path(self, inputs_root: Path) -> Path:
+        return inputs_root / f"y{self.year}" / f"day_{self.day:02d}.txt"
+
+
+@dataclass
+class DayResult:
+    spec: DaySpec
+    answers: dict[int, str] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    cached: set[int] = field(default_factory=set)
+    error: str | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return sum(self.timings.values())
+
+
+def discover(
+    years: Iterable[int] | None = None, days: Iterable[int] | None = None
+) -> list[DaySpec]:
+    wanted_years = set(years) if years else None
+    wanted_days = set(days) if days else None
+    specs: list[DaySpec] = []
+    for year_dir in PACKAGE_ROOT.glob("y[0-9][0-9][0-9][0-9]"):
+        year = int(year_dir.name[1:])
+        if wanted_years is not None and year not in wanted_years:
+            continue
+        for path in year_dir.glob("day_*.py"):
+            match = _DAY_FILE.fullmatch(path.name)
+            if match is None:
+                continue
+            day = int(match.group(1))
+            if wanted_days is not None and day not in wanted_days:
+                continue
+            specs.append(DaySpec(year, day))
+    return sorted(specs)
+
+
+def _required_positionals(func: Callable[..., Any]) -> list[inspect.Parameter]:
+    return [
+        param
+        for param in inspect.signature(func).parameters.values()
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+        and param.default is param.empty
+    ]
+
+
+def part_call(spec: DaySpec, module: ModuleType, part: int) -> PartCall | None:
+    override = CALL_OVERRIDES.get((spec.year, spec.day, part))
+    if override is not None:
+        return override
+
+    solver = getattr(module, f"solve_part{part}", None)
+    if solver is None:
+        return None
+
+    params = _required_positionals(solver)
+    if params and params[0].name == "raw":
+        return lambda module, parsed, raw: solver(raw)
+    if len(params) <= 1:
+        return lambda module, parsed, raw: solver(parsed)
+    return lambda module, parsed, raw: solver(*parsed)
+
+
+def parse_input(module: ModuleType, raw: str) -> Any:
+    parse = getattr(module, "parse", None)
+    return raw if parse is None else parse(raw)
+
+
+def format_answer(answer: Any) -> str:
+    return str(answer).replace("\n", " | ")
+
+
+def run_day(
+    spec: DaySpec, inputs_root: Path = DEFAULT_INPUTS, cache: AnswerCache | None = None
+) -> DayResult:
+    result = DayResult(spec)
+    path = spec.input_path(inputs_root)
+    if not path.exists():
+        result.error = f"missing input {path}"
+        return result
+
+    try:
+        module = importlib.import_module(spec.module_name)
+        raw = path.read_text(encoding="utf-8")
+        for part in PARTS:
+            call = part_call(spec, module, part)
+            if call is None:
+                continue
+            label = f"part{part}"
+            if cache is not None:
+                start = time.perf_counter()
+                key = cache.key(module, raw, label)
+                cached = cache.get(key)
+                if cached is not None:
+                    result.timings[label] = time.perf_counter() - start
+                    result.answers[part] = cached
+                    result.cached.add(part)
+                    continue
+
+            # Parse afresh for each part: several solvers mutate their parsed input.
+            start = time.perf_counter()
+            parsed = parse_input(module, raw)
+            result.timings[f"parse{part}"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            answer = call(module, parsed, raw)
+            result.timings[label] = time.perf_counter() - start
+            result.answers[part] = str(answer)
+            if cache is not None:
+                cache.put(key, result.answers[part])
+    except Exception as error:  # noqa: BLE001 - report and keep the batch going
+        result.error = f"{type(error).__name__}: {error}"
+    return result
+
+
+def run_all(
+    specs: Sequence[DaySpec],
+    inputs_root: Path = DEFAULT_INPUTS,
+    workers: int | None = None,
+    task: Callable[[DaySpec, Path], T] = run_day,  # type: ignore[assignment]
+) -> list[T]:
+    if not specs:
+        return []
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [task(spec, inputs_root) for spec in specs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(specs))) as pool:
+        return list(pool.map(task, specs, [inputs_root] * len(specs)))
+
+
+def format_table(results: Sequence[DayResult]) -> str:
+    header = ("Year", "Day", "Part 1", "Part 2", "Time")
+    rows = []
+    for result in results:
+        if result.error is not None:
+            part1, part2 = result.error, ""
+        else:
+            part1 = format_answer(result.answers.get(1, "-"))
+            part2 = format_answer(result.answers.get(2, "-"))
+        rows.append(
+            (
+                str(result.spec.year),
+                f"{result.spec.day:02d}",
+                part1,
+                part2,
+                f"{result.elapsed:.3f}s" + (" (cached)" if result.cached else ""),
+            )
+        )
+    return render_table(header, rows)
+
+
+def render_table(header: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(header, widths)).rstrip()]
+    lines.append("  ".join("-" * width for width in widths))
+    for row in rows:
+        lines.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+    return "\n".join(lines)
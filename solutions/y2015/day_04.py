@@ -1,21 +1,20 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 from pathlib import Path
 
+from solutions.common import md5_mining
+
 
 def parse(raw: str) -> str:
     return raw.strip()
 
 
-def find_lowest_with_prefix(secret: str, prefix: str) -> int:
-    index = 1
-    while True:
-        digest = hashlib.md5(f"{secret}{index}".encode("utf-8")).hexdigest()
-        if digest.startswith(prefix):
-            return index
-        index += 1
+def find_lowest_with_prefix(secret: str, prefix: str, workers: int | None = None) -> int:
+    if prefix.strip("0"):
+        raise ValueError(f"Only all-zero prefixes are supported, got {prefix!r}.")
+    index, _ = md5_mining.first_hit(secret, len(prefix), start=1, workers=workers)
+    return index
 
 
 def solve_part1(secret: str) -> int:
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import argparse
+from itertools import compress as compress_items
+from operator import mul
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, Sequence, Tuple
+
+from solutions.common import lanes
 
 Instruction = Tuple[str, int, int, int, int]
 
@@ -31,39 +35,110 @@ def parse(raw: str) -> list[Instruction]:
     return instructions
 
 
-def solve_part1(instructions: Iterable[Instruction]) -> int:
-    grid = [[False] * 1000 for _ in range(1000)]
+class LightGrid:
+    """The light grid cut along every instruction edge into blocks that always change together.
+
+    With ``compress=False`` every coordinate is a cut, which gives the plain dense grid;
+    otherwise the cost of each instruction depends on how many distinct edges the
+    instructions have, not on the area they cover. Rows of blocks are stored as ints:
+    one bit per block for on/off, or one 64-bit lane per block for brightness.
+    """
+
+    def __init__(
+        self, instructions: Sequence[Instruction], width: int = 1000, height: int = 1000, compress: bool = True
+    ) -> None:
+        self.x_cuts = _cuts(width, ((x1, x2 + 1) for _, x1, _, x2, _ in instructions), compress)
+        self.y_cuts = _cuts(height, ((y1, y2 + 1) for _, _, y1, _, y2 in instructions), compress)
+        self.x_index = {x: index for index, x in enumerate(self.x_cuts)}
+        self.y_index = {y: index for index, y in enumerate(self.y_cuts)}
+        self.row_sizes = [b - a for a, b in zip(self.x_cuts, self.x_cuts[1:])]
+        self.column_sizes = [b - a for a, b in zip(self.y_cuts, self.y_cuts[1:])]
+
+    def blocks(self, x1: int, y1: int, x2: int, y2: int) -> tuple[range, int, int]:
+        """Block rows, then the first and past-the-end block columns, of a rectangle."""
+        rows = range(self.x_index[x1], self.x_index[x2 + 1])
+        return rows, self.y_index[y1], self.y_index[y2 + 1]
+
+
+def _cuts(size: int, spans: Iterable[tuple[int, int]], compress: bool) -> list[int]:
+    if not compress:
+        return list(range(size + 1))
+    cuts = {0, size}
+    for start, end in spans:
+        cuts.add(start)
+        cuts.add(end)
+    return sorted(cuts)
+
+
+def count_lit(
+    instructions: Sequence[Instruction], width: int = 1000, height: int = 1000, compress: bool = True
+) -> int:
+    grid = LightGrid(instructions, width, height, compress)
+    rows = [0] * len(grid.row_sizes)
     for action, x1, y1, x2, y2 in instructions:
-        for x in range(x1, x2 + 1):
-            row = grid[x]
+        block_rows, lo, hi = grid.blocks(x1, y1, x2, y2)
+        mask = (1 << hi) - (1 << lo)
+        for row in block_rows:
             if action == "on":
-                for y in range(y1, y2 + 1):
-                    row[y] = True
+                rows[row] |= mask
             elif action == "off":
-                for y in range(y1, y2 + 1):
-                    row[y] = False
+                rows[row] &= ~mask
             else:  # toggle
-                for y in range(y1, y2 + 1):
-                    row[y] = not row[y]
-    return sum(sum(1 for cell in row if cell) for row in grid)
+                rows[row] ^= mask
+
+    uniform = all(size == 1 for size in grid.column_sizes)
+    columns = len(grid.column_sizes)
+    total = 0
+    for size, row in zip(grid.row_sizes, rows):
+        if uniform:
+            total += size * row.bit_count()
+        else:
+            lit = map("1".__eq__, reversed(format(row, f"0{columns}b")))
+            total += size * sum(compress_items(grid.column_sizes, lit))
+    return total
 
 
-def solve_part2(instructions: Iterable[Instruction]) -> int:
-    grid = [[0] * 1000 for _ in range(1000)]
+def total_brightness(
+    instructions: Sequence[Instruction], width: int = 1000, height: int = 1000, compress: bool = True
+) -> int:
+    grid = LightGrid(instructions, width, height, compress)
+    columns = len(grid.column_sizes)
+    # Adding this sets a lane's top bit exactly when the lane was non-zero.
+    nonzero_probe = lanes.lane_constant((1 << 63) - 1, columns)
+    top_bits = lanes.lane_constant(1 << 63, columns)
+    rows = [0] * len(grid.row_sizes)
     for action, x1, y1, x2, y2 in instructions:
-        for x in range(x1, x2 + 1):
-            row = grid[x]
-            if action == "on":
-                for y in range(y1, y2 + 1):
-                    row[y] += 1
-            elif action == "off":
-                for y in range(y1, y2 + 1):
-                    if row[y] > 0:
-                        row[y] -= 1
-            else:  # toggle
-                for y in range(y1, y2 + 1):
-                    row[y] += 2
-    return sum(sum(row) for row in grid)
+        block_rows, lo, hi = grid.blocks(x1, y1, x2, y2)
+        span = lanes.lane_constant(1, hi) ^ lanes.lane_constant(1, lo)
+        if action == "on":
+            for row in block_rows:
+                rows[row] += span
+        elif action == "off":
+            for row in block_rows:
+                value = rows[row]
+                rows[row] = value - (((value + nonzero_probe) & top_bits) >> 63 & span)
+        else:  # toggle
+            span <<= 1
+            for row in block_rows:
+                rows[row] += span
+
+    total = 0
+    for size, row in zip(grid.row_sizes, rows):
+        if row:
+            total += size * sum(map(mul, lanes.unpack(row, columns), grid.column_sizes))
+    return total
+
+
+def solve_part1(
+    instructions: Sequence[Instruction], width: int = 1000, height: int = 1000, compress: bool = True
+) -> int:
+    return count_lit(instructions, width, height, compress)
+
+
+def solve_part2(
+    instructions: Sequence[Instruction], width: int = 1000, height: int = 1000, compress: bool = True
+) -> int:
+    return total_brightness(instructions, width, height, compress)
 
 
 def main() -> None:
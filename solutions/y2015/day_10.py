@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import argparse
+from collections import Counter
 from itertools import groupby
 from pathlib import Path
+from typing import Dict, Iterable, List
 
 
 def parse(raw: str) -> str:
@@ -24,12 +26,93 @@ def iterate(sequence: str, times: int) -> str:
     return current
 
 
+# Days a candidate split is followed for, and how much of the right side's prefix is kept.
+SPLIT_HORIZON = 32
+PREFIX_LENGTH = 32
+
+
+def splits(left_last: str, right: str) -> bool:
+    """Whether ``L + right`` evolves as ``L`` and ``right`` side by side for good.
+
+    ``L`` always ends in ``left_last``, so the two halves stay apart exactly as long
+    as the evolved right side never starts with that digit. Only an exact prefix of
+    the right side is tracked; if it runs out the split is refused, which is safe.
+    """
+    prefix, complete = right[:PREFIX_LENGTH], len(right) <= PREFIX_LENGTH
+    for _ in range(SPLIT_HORIZON):
+        if prefix[0] == left_last:
+            return False
+        runs = [(digit, sum(1 for _ in group)) for digit, group in groupby(prefix)]
+        if not complete:
+            runs.pop()  # The last run may continue past the kept prefix.
+            if not runs:
+                return False
+        evolved = "".join(f"{count}{digit}" for digit, count in runs)
+        complete = complete and len(evolved) <= PREFIX_LENGTH
+        prefix = evolved[:PREFIX_LENGTH]
+    return True
+
+
+def elements(sequence: str) -> list[str]:
+    """Cut ``sequence`` at every point where its halves never interact again.
+
+    Once a sequence has aged a couple of days these pieces are Conway's elements;
+    early pieces that are not yet elements simply decay as strings until they are.
+    """
+    pieces: list[str] = []
+    start = 0
+    for index in range(1, len(sequence)):
+        if sequence[index - 1] != sequence[index] and splits(
+            sequence[index - 1], sequence[index : index + PREFIX_LENGTH + 1]
+        ):
+            pieces.append(sequence[start:index])
+            start = index
+    pieces.append(sequence[start:])
+    return pieces
+
+
+class Decay:
+    """Memoised one-day decay of each element into the elements it becomes."""
+
+    def __init__(self) -> None:
+        self.products: Dict[str, List[str]] = {}
+
+    def __call__(self, element: str) -> List[str]:
+        products = self.products.get(element)
+        if products is None:
+            products = self.products[element] = elements(look_and_say(element))
+        return products
+
+    def closure(self, start: Iterable[str]) -> List[str]:
+        seen = dict.fromkeys(start)
+        pending = list(seen)
+        while pending:
+            for product in self(pending.pop()):
+                if product not in seen:
+                    seen[product] = None
+                    pending.append(product)
+        return list(seen)
+
+
+def sequence_length(sequence: str, times: int) -> int:
+    """Length after ``times`` days, tracked as a count per element rather than a string."""
+    decay = Decay()
+    counts = Counter(elements(sequence))
+    for _ in range(times):
+        following: Counter[str] = Counter()
+        for element, count in counts.items():
+            for product in decay(element):
+                following[product] += count
+        counts = following
+    return sum(len(element) * count for element, count in counts.items())
+
+
 def solve_part1(sequence: str) -> int:
-    return len(iterate(sequence, 40))
+    return sequence_length(sequence, 40)
 
 
 def solve_part2(sequence: str) -> int:
-    return len(iterate(sequence, 50))
+    return sequence_length(sequence, 50)
 
 
 def main() -> None:
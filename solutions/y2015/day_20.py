@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import argparse
+from itertools import count, repeat
+from operator import add
 from pathlib import Path
 
 
@@ -8,21 +10,46 @@ def parse(raw: str) -> int:
     return int(raw.strip())
 
 
-def find_min_house(target: int, multiplier: int, *, delivery_limit: int | None) -> int:
-    size = max(1, target // multiplier)
-    while True:
-        houses = [0] * (size + 1)
-        for elf in range(1, size + 1):
-            delivered = 0
-            for house in range(elf, size + 1, elf):
-                houses[house] += elf * multiplier
-                delivered += 1
-                if delivery_limit is not None and delivered >= delivery_limit:
-                    break
-        for house, presents in enumerate(houses):
-            if house > 0 and presents >= target:
-                return house
-        size *= 2
+SEGMENT_SIZE = 1 << 16
+
+
+def elf_sums(lo: int, hi: int, delivery_limit: int | None, small: int) -> list[int]:
+    """Sum of the elves visiting each house in ``[lo, hi)``, as strided slice additions.
+
+    Elves below ``small`` add their number along a stride of their own. Larger elves
+    reach a segment at most ``(hi - 1) // small`` times, so they are handled per visit
+    number ``k`` instead: those visiting for the k-th time form a run of consecutive
+    elves landing ``k`` houses apart.
+    """
+    houses = [0] * (hi - lo)
+    for elf in range(1, min(small, hi)):
+        first = max(elf, -(-lo // elf) * elf)
+        last = hi if delivery_limit is None else min(hi, elf * delivery_limit + 1)
+        if first < last:
+            view = slice(first - lo, last - lo, elf)
+            houses[view] = map(add, houses[view], repeat(elf))
+    visits = (hi - 1) // small
+    if delivery_limit is not None:
+        visits = min(visits, delivery_limit)
+    for k in range(1, visits + 1):
+        first_elf = max(small, -(-lo // k))
+        end_elf = -(-hi // k)
+        if first_elf < end_elf:
+            view = slice(k * first_elf - lo, k * (end_elf - 1) - lo + 1, k)
+            houses[view] = map(add, houses[view], range(first_elf, end_elf))
+    return houses
+
+
+def find_min_house(
+    target: int, multiplier: int, *, delivery_limit: int | None, segment_size: int = SEGMENT_SIZE
+) -> int:
+    """Sieve the houses one segment at a time, so memory stays at ``segment_size``."""
+    needed = max(1, -(-target // multiplier))
+    for lo in count(0, segment_size):
+        houses = elf_sums(lo, lo + segment_size, delivery_limit, segment_size)
+        if max(houses) >= needed:
+            return lo + next(index for index, elves in enumerate(houses) if elves >= needed)
+    raise AssertionError("unreachable: the segments are unbounded")
 
 
 def solve_part1(target: int) -> int:
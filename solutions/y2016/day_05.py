@@ -1,31 +1,30 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
+from contextlib import closing
 from pathlib import Path
 
+from solutions.common import md5_mining
+
 
 def parse(raw: str) -> str:
     return raw.strip()
 
 
-def find_hashes(door_id: str) -> tuple[str, str]:
+def find_hashes(door_id: str, workers: int | None = None) -> tuple[str, str]:
     password1: list[str] = []
     password2 = ["_"] * 8
     filled = 0
-    index = 0
-    while len(password1) < 8 or filled < 8:
-        digest = hashlib.md5(f"{door_id}{index}".encode("utf-8")).hexdigest()
-        if digest.startswith("00000"):
+    with closing(md5_mining.mine(door_id, 5, workers=workers)) as hits:
+        for _, digest in hits:
+            sixth = md5_mining.nibble(digest, 5)
             if len(password1) < 8:
-                password1.append(digest[5])
-            pos_char = digest[5]
-            if pos_char.isdigit():
-                position = int(pos_char)
-                if 0 <= position < 8 and password2[position] == "_":
-                    password2[position] = digest[6]
-                    filled += 1
-        index += 1
+                password1.append(f"{sixth:x}")
+            if sixth < 8 and password2[sixth] == "_":
+                password2[sixth] = f"{md5_mining.nibble(digest, 6):x}"
+                filled += 1
+            if len(password1) == 8 and filled == 8:
+                break
     return "".join(password1), "".join(password2)
 
 
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Sequence
 
+from solutions.common import assembunny
+
 
 @dataclass(frozen=True)
 class Instruction:
@@ -12,6 +14,10 @@ class Instruction:
     x: str
     y: str | None = None
 
+    @property
+    def args(self) -> tuple[str, ...]:
+        return (self.x,) if self.y is None else (self.x, self.y)
+
 
 def parse(raw: str) -> List[Instruction]:
     instructions: list[Instruction] = []
@@ -27,38 +33,9 @@ def parse(raw: str) -> List[Instruction]:
     return instructions
 
 
-def value(operand: str, registers: Dict[str, int]) -> int:
-    if operand.lstrip("-").isdigit():
-        return int(operand)
-    return registers.get(operand, 0)
-
-
 def run(instructions: Sequence[Instruction], initial: Dict[str, int] | None = None) -> Dict[str, int]:
-    registers = {"a": 0, "b": 0, "c": 0, "d": 0}
-    if initial:
-        registers.update(initial)
-    pointer = 0
-    while 0 <= pointer < len(instructions):
-        instr = instructions[pointer]
-        if instr.opcode == "cpy":
-            if instr.y and instr.y in registers:
-                registers[instr.y] = value(instr.x, registers)
-            pointer += 1
-        elif instr.opcode == "inc":
-            registers[instr.x] += 1
-            pointer += 1
-        elif instr.opcode == "dec":
-            registers[instr.x] -= 1
-            pointer += 1
-        elif instr.opcode == "jnz":
-            offset = value(instr.y or "0", registers)
-            if value(instr.x, registers) != 0:
-                pointer += offset
-            else:
-                pointer += 1
-        else:
-            raise ValueError(f"Unknown opcode: {instr.opcode}")
-    return registers
+    program = [(instr.opcode, instr.args) for instr in instructions]
+    return assembunny.Machine(program, initial).run()
 
 
 def solve_part1(instructions: Sequence[Instruction]) -> int:
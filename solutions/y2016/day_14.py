@@ -1,51 +1,95 @@
 from __future__ import annotations
 
 import argparse
-import functools
 import hashlib
 import re
+from collections import defaultdict, deque
+from contextlib import closing
 from pathlib import Path
+from typing import Iterator
+
+from solutions.cache import AnswerCache
+from solutions.common import parallel
 
 TRIPLE_RE = re.compile(r"(.)\1\1")
+QUINTUPLE_RE = re.compile(r"(.)\1{4}")
+
+LOOKAHEAD = 1000
+DEFAULT_BATCH_SIZE = 1000
 
 
 def parse(raw: str) -> str:
     return raw.strip()
 
 
-@functools.lru_cache(maxsize=None)
 def compute_hash(salt: str, index: int, stretch: int) -> str:
-    digest = hashlib.md5(f"{salt}{index}".encode("utf-8")).hexdigest()
-    for _ in range(stretch):
-        digest = hashlib.md5(digest.encode("utf-8")).hexdigest()
-    return digest
-
-
-def nth_key_index(salt: str, count: int = 64, stretch: int = 0) -> int:
+    return stretched_batch(salt, stretch, index, index + 1)[0]
+
+
+def stretched_batch(salt: str, stretch: int, start: int, stop: int) -> list[str]:
+    md5 = hashlib.md5
+    digests: list[str] = []
+    for index in range(start, stop):
+        digest = md5(f"{salt}{index}".encode("ascii")).hexdigest()
+        for _ in range(stretch):
+            digest = md5(digest.encode("ascii")).hexdigest()
+        digests.append(digest)
+    return digests
+
+
+def stretched_hashes(
+    salt: str,
+    stretch: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int | None = None,
+) -> Iterator[str]:
+    batches = parallel.ordered_chunks(stretched_batch, (salt, stretch), 0, batch_size, workers)
+    with closing(batches):
+        for batch in batches:
+            yield from batch
+
+
+def nth_key_index(
+    salt: str,
+    count: int = 64,
+    stretch: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int | None = None,
+) -> int:
+    # Index ``j - LOOKAHEAD`` is judged once hash ``j`` is known, so only the last
+    # LOOKAHEAD + 1 triples and the quintuple positions inside that window are kept.
+    triples: deque[str | None] = deque(maxlen=LOOKAHEAD + 1)
+    quintuples: dict[str, deque[int]] = defaultdict(deque)
     found = 0
-    index = 0
-    while True:
-        digest = compute_hash(salt, index, stretch)
-        match = TRIPLE_RE.search(digest)
-        if match:
-            target = match.group(1) * 5
-            for future in range(index + 1, index + 1001):
-                future_digest = compute_hash(salt, future, stretch)
-                if target in future_digest:
-                    found += 1
-                    if found == count:
-                        return index
-                    break
-        index += 1
+    hashes = stretched_hashes(salt, stretch, batch_size, workers)
+    with closing(hashes):
+        for j, digest in enumerate(hashes):
+            match = TRIPLE_RE.search(digest)
+            triples.append(match.group(1) if match else None)
+            for char in set(QUINTUPLE_RE.findall(digest)):
+                positions = quintuples[char]
+                positions.append(j)
+                while positions[0] < j - LOOKAHEAD:
+                    positions.popleft()
+
+            index = j - LOOKAHEAD
+            if index < 0 or triples[0] is None:
+                continue
+            positions = quintuples[triples[0]]
+            while positions and positions[0] <= index:
+                positions.popleft()
+            if positions:
+                found += 1
+                if found == count:
+                    return index
+    raise AssertionError("unreachable: the hash stream is unbounded")
 
 
 def solve_part1(salt: str) -> int:
-    compute_hash.cache_clear()
     return nth_key_index(salt, count=64, stretch=0)
 
 
 def solve_part2(salt: str) -> int:
-    compute_hash.cache_clear()
     return nth_key_index(salt, count=64, stretch=2016)
 
 
@@ -55,12 +99,14 @@ def main() -> None:
     parser.add_argument("--part", choices={"1", "2", "both"}, default="both")
     args = parser.parse_args()
 
-    salt = parse(args.input_path.read_text(encoding="utf-8"))
+    raw = args.input_path.read_text(encoding="utf-8")
+    salt = parse(raw)
+    cache = AnswerCache()
 
     if args.part in {"1", "both"}:
-        print(f"Part 1: {solve_part1(salt)}")
+        print(f"Part 1: {cache.answer(__name__, raw, 'part1', lambda: solve_part1(salt))}")
     if args.part in {"2", "both"}:
-        print(f"Part 2: {solve_part2(salt)}")
+        print(f"Part 2: {cache.answer(__name__, raw, 'part2', lambda: solve_part2(salt))}")
 
 
 if __name__ == "__main__":
@@ -13,24 +13,62 @@ def dragon_curve(data: str) -> str:
     return f"{data}0{inverse}"
 
 
-def fill_disk(state: str, length: int) -> str:
-    data = state
-    while len(data) < length:
-        data = dragon_curve(data)
-    return data[:length]
-
-
-def checksum(data: str) -> str:
-    result = data
-    while len(result) % 2 == 0:
-        pairs = ["1" if result[i] == result[i + 1] else "0" for i in range(0, len(result), 2)]
-        result = "".join(pairs)
-    return result
+def joiner_ones(count: int) -> int:
+    """Ones among the first ``count`` joiner bits of an unbounded dragon fill.
+
+    Joiner ``i`` (1-based) is 1 exactly when the odd part of ``i`` is 3 mod 4.
+    """
+    total = 0
+    while count:
+        total += (count + 1) // 4
+        count >>= 1
+    return total
+
+
+class DragonFill:
+    """Counts ones in prefixes of the dragon fill of ``state`` without building it.
+
+    The fill is ``a j0 b j1 a j2 b ...``: the seed ``a`` alternates with its reversed
+    complement ``b``, each block followed by one joiner bit of the dragon sequence.
+    """
+
+    def __init__(self, state: str) -> None:
+        self.size = len(state)
+        seed = [int(char) for char in state]
+        inverse = [1 - bit for bit in reversed(seed)]
+        self.seed_ones = [0]
+        self.inverse_ones = [0]
+        for bit, flipped in zip(seed, inverse):
+            self.seed_ones.append(self.seed_ones[-1] + bit)
+            self.inverse_ones.append(self.inverse_ones[-1] + flipped)
+
+    def ones_before(self, position: int) -> int:
+        blocks, offset = divmod(position, self.size + 1)
+        # A seed block and an inverse block together hold exactly ``size`` ones.
+        total = blocks // 2 * self.size + (blocks % 2) * self.seed_ones[-1]
+        total += joiner_ones(blocks)
+        return total + (self.inverse_ones if blocks % 2 else self.seed_ones)[offset]
+
+
+def checksum(state: str, length: int) -> str:
+    """Checksum of the first ``length`` fill bits, one parity per power-of-two chunk.
+
+    Each halving pass is an XNOR of pairs, so after at least one pass a digit is 1
+    exactly when its chunk holds an even number of ones.
+    """
+    fill = DragonFill(state)
+    chunk = length & -length
+    digits = []
+    previous = 0
+    for end in range(chunk, length + 1, chunk):
+        ones = fill.ones_before(end)
+        digits.append((ones - previous) % 2 ^ (chunk > 1))
+        previous = ones
+    return "".join(map(str, digits))
 
 
 def solve(state: str, length: int) -> str:
-    filled = fill_disk(state, length)
-    return checksum(filled)
+    return checksum(state, length)
 
 
 def solve_part1(state: str) -> str:
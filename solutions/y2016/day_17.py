@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import argparse
 import collections
-import hashlib
 from pathlib import Path
 from typing import Deque, Optional
 
+from solutions.common import md5_mining
+
 MOVES = [
     ("U", (0, -1)),
     ("D", (0, 1)),
@@ -19,10 +20,10 @@ def parse(raw: str) -> str:
 
 
 def open_doors(passcode: str, path: str) -> list[str]:
-    digest = hashlib.md5(f"{passcode}{path}".encode("utf-8")).hexdigest()
+    digest = md5_mining.md5_digest(passcode, path)
     result: list[str] = []
-    for (direction, _), char in zip(MOVES, digest[:4]):
-        if char in "bcdef":
+    for position, (direction, _) in enumerate(MOVES):
+        if md5_mining.nibble(digest, position) > 0xA:
             result.append(direction)
     return result
 
@@ -8,22 +8,52 @@ def parse(raw: str) -> str:
     return raw.strip()
 
 
+# Cap on the rows remembered for cycle checks.
+HISTORY_LIMIT = 1 << 16
+
+
+def encode(row: str) -> int:
+    """One bit per tile, set for traps."""
+    return int(row.replace("^", "1").replace(".", "0") or "0", 2)
+
+
 def next_row(row: str) -> str:
-    extended = f".{row}."
-    result_chars: list[str] = []
-    for i in range(len(row)):
-        left, center, right = extended[i : i + 3]
-        trap = (left + center + right) in {"^^.", ".^^", "^..", "..^"}
-        result_chars.append("^" if trap else ".")
-    return "".join(result_chars)
+    width = len(row)
+    bits = step(encode(row), (1 << width) - 1)
+    return format(bits, f"0{width}b").replace("1", "^").replace("0", ".") if width else ""
+
+
+def step(row: int, mask: int) -> int:
+    # A tile is a trap exactly when its left and right neighbours differ.
+    return ((row << 1) ^ (row >> 1)) & mask
 
 
 def safe_tiles(first_row: str, rows: int) -> int:
-    current = first_row
-    total = current.count(".")
-    for _ in range(1, rows):
-        current = next_row(current)
-        total += current.count(".")
+    width = len(first_row)
+    mask = (1 << width) - 1
+    row = encode(first_row)
+    # Only the first HISTORY_LIMIT rows are remembered, but every row is looked up, so
+    # any cycle that starts early is still caught however wide the rows are.
+    seen: dict[int, int] = {}
+    totals: list[int] = []
+    total = 0
+    for index in range(rows):
+        if not row:
+            return total + (rows - index) * width  # An all-safe row stays all safe.
+        start = seen.get(row)
+        if start is not None:
+            period = index - start
+            cycles, extra = divmod(rows - index, period)
+            total += cycles * (total - totals[start])
+            for _ in range(extra):
+                total += width - row.bit_count()
+                row = step(row, mask)
+            return total
+        if index < HISTORY_LIMIT:
+            seen[row] = index
+            totals.append(total)
+        total += width - row.bit_count()
+        row = step(row, mask)
     return total
 
 
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import collections
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
+from solutions.common import dial
+
 Grid = List[str]
 Point = Tuple[int, int]
 
@@ -26,29 +27,39 @@ def neighbours(point: Point) -> Iterable[Point]:
         yield x + dx, y + dy
 
 
-def bfs(grid: Grid, start: Point) -> Dict[Point, int]:
+def adjacency(grid: Grid) -> list[list[tuple[int, int]]]:
     width = len(grid[0])
     height = len(grid)
-    queue = collections.deque([(start, 0)])
-    distances: dict[Point, int] = {start: 0}
-    while queue:
-        point, dist = queue.popleft()
-        for nx, ny in neighbours(point):
-            if not (0 <= nx < width and 0 <= ny < height):
-                continue
-            if grid[ny][nx] == "#":
-                continue
-            if (nx, ny) in distances:
+    edges: list[list[tuple[int, int]]] = [[] for _ in range(width * height)]
+    for y, row in enumerate(grid):
+        for x, ch in enumerate(row):
+            if ch == "#":
                 continue
-            distances[(nx, ny)] = dist + 1
-            queue.append(((nx, ny), dist + 1))
-    return distances
+            for nx, ny in neighbours((x, y)):
+                if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] != "#":
+                    edges[y * width + x].append((ny * width + nx, 1))
+    return edges
+
+
+def bfs(grid: Grid, start: Point, edges: list[list[tuple[int, int]]] | None = None) -> Dict[Point, int]:
+    # Flat cell ids; every step costs 1, so the bucket queue degenerates to a BFS.
+    width = len(grid[0])
+    if edges is None:
+        edges = adjacency(grid)
+    x, y = start
+    dist = dial.shortest_costs(len(edges), [y * width + x], edges.__getitem__, max_weight=1)
+    return {
+        (index % width, index // width): steps
+        for index, steps in enumerate(dist)
+        if steps != dial.UNREACHED
+    }
 
 
 def pairwise_distances(grid: Grid, locations: Dict[str, Point]) -> Dict[tuple[str, str], int]:
     distances: dict[tuple[str, str], int] = {}
+    edges = adjacency(grid)
     for label, position in locations.items():
-        dists = bfs(grid, position)
+        dists = bfs(grid, position, edges)
         for other_label, other_position in locations.items():
             if label == other_label:
                 continue
@@ -3,7 +3,9 @@ from __future__ import annotations
 import argparse
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Sequence
+from typing import Sequence
+
+from solutions.common import assembunny
 
 
 @dataclass(frozen=True)
@@ -22,57 +24,24 @@ def parse(raw: str) -> list[Instruction]:
     return program
 
 
-def value(operand: str, registers: Dict[str, int]) -> int:
-    if operand.lstrip("-").isdigit():
-        return int(operand)
-    return registers.get(operand, 0)
-
-
 def is_clock_signal(program: Sequence[Instruction], initial_a: int, required: int = 100) -> bool:
-    registers = {"a": initial_a, "b": 0, "c": 0, "d": 0}
-    ip = 0
+    machine = assembunny.Machine([(inst.opcode, inst.args) for inst in program], {"a": initial_a})
     expected = 0
     produced = 0
-    steps = 0
-    max_steps = 1_000_000
-
-    while 0 <= ip < len(program) and steps < max_steps:
-        opcode, args = program[ip].opcode, program[ip].args
-        steps += 1
-
-        if opcode == "cpy":
-            x, y = args
-            if y in registers:
-                registers[y] = value(x, registers)
-            ip += 1
-        elif opcode == "inc":
-            (x,) = args
-            if x in registers:
-                registers[x] += 1
-            ip += 1
-        elif opcode == "dec":
-            (x,) = args
-            if x in registers:
-                registers[x] -= 1
-            ip += 1
-        elif opcode == "jnz":
-            x, y = args
-            if value(x, registers) != 0:
-                ip += value(y, registers)
-            else:
-                ip += 1
-        elif opcode == "out":
-            (x,) = args
-            signal = value(x, registers)
-            if signal not in (0, 1) or signal != expected:
-                return False
-            expected ^= 1
-            produced += 1
-            if produced >= required:
-                return True
-            ip += 1
-        else:
-            ip += 1
+    # Machine state right after each output; a repeat means the signal loops forever.
+    seen: dict[tuple[int, tuple[int, ...], int], int] = {}
+
+    for signal in machine.outputs(max_steps=1_000_000):
+        if signal != expected:
+            return False
+        expected ^= 1
+        produced += 1
+        if produced >= required:
+            return True
+        state = machine.state()
+        if state in seen:
+            return (produced - seen[state]) % 2 == 0
+        seen[state] = produced
     return False
 
 
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import argparse
+from itertools import compress
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterator, Tuple
+
+from solutions.common.lanes import LANE_BYTES, lane_constant, pack, to_bytes, unpack
 
 
 MODULUS = 2_147_483_647
 FACTOR_A = 16807
 FACTOR_B = 48271
+LOW_MASK = 0xFFFF
+DEFAULT_BLOCK_SIZE = 1 << 12
 
 
 def parse(raw: str) -> Tuple[int, int]:
@@ -17,33 +22,96 @@ def parse(raw: str) -> Tuple[int, int]:
     return seed_a, seed_b
 
 
-def generator(seed: int, factor: int, multiple: int = 1) -> Iterable[int]:
-    value = seed
+def raw_blocks(seed: int, factor: int, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[int]:
+    # Each block packs ``block_size`` consecutive values into 64-bit lanes of one int.
+    # Multiplying by factor**block_size advances every lane a whole block at once; the
+    # lane-wise product stays below 2**62, and two Mersenne folds (x & M) + (x >> 31)
+    # bring it back under M without any lane bleeding into its neighbour.
+    powers = [pow(factor, index, MODULUS) for index in range(1, block_size + 1)]
+    block = pack([seed * power % MODULUS for power in powers])
+    jump = powers[-1]
+    modulus = lane_constant(MODULUS, block_size)
+    yield block
     while True:
-        value = (value * factor) % MODULUS
-        if value % multiple == 0:
-            yield value
-
+        block *= jump
+        block = (block & modulus) + ((block >> 31) & modulus)
+        block = (block & modulus) + ((block >> 31) & modulus)
+        yield block
+
+
+def mismatched_lanes(diff: int, lanes: int) -> int:
+    # Adding 0xFFFF to a lane holding a 16-bit value carries into bit 16 exactly when
+    # the lane is non-zero; lanes above ``lanes`` are masked off by the carry pattern.
+    return ((diff + lane_constant(LOW_MASK, lanes)) & lane_constant(LOW_MASK + 1, lanes)).bit_count()
+
+
+def qualifying_lanes(block: int, multiple: int, lanes: int) -> bytes:
+    # One byte per lane, non-zero where the lane is a multiple of ``multiple`` (a power
+    # of two): adding ``multiple - 1`` to the masked low bits carries into bit
+    # log2(multiple) exactly for non-multiples, and that flag is flipped and moved to
+    # bit 0 of the lane so that every eighth byte of the little-endian form selects it.
+    low = lane_constant(multiple - 1, lanes)
+    carry = lane_constant(multiple, lanes)
+    flags = (((block & low) + low) & carry) ^ carry
+    return to_bytes(flags >> (multiple.bit_length() - 1), lanes)[::LANE_BYTES]
+
+
+def filtered_blocks(seed: int, factor: int, multiple: int, block_size: int) -> Iterator[list[int]]:
+    # Compaction keeps the low bits of the qualifying lanes and re-cuts them into runs
+    # of exactly ``block_size``; ``compress`` keeps the selection out of Python bytecode.
+    if multiple & (multiple - 1):
+        raise ValueError(f"Multiple must be a power of two, got {multiple}")
+    low = lane_constant(LOW_MASK, block_size)
+    pending: list[int] = []
+    for block in raw_blocks(seed, factor, block_size):
+        pending += compress(unpack(block & low, block_size), qualifying_lanes(block, multiple, block_size))
+        while len(pending) >= block_size:
+            yield pending[:block_size]
+            del pending[:block_size]
+
+
+def count_matches(
+    seed_a: int,
+    seed_b: int,
+    pairs: int,
+    multiple_a: int = 1,
+    multiple_b: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> int:
+    if multiple_a == multiple_b == 1:
+        low = lane_constant(LOW_MASK, block_size)
+        blocks = zip(raw_blocks(seed_a, FACTOR_A, block_size), raw_blocks(seed_b, FACTOR_B, block_size))
+        diffs = ((block_a ^ block_b) & low for block_a, block_b in blocks)
+    else:
+        blocks = zip(
+            filtered_blocks(seed_a, FACTOR_A, multiple_a, block_size),
+            filtered_blocks(seed_b, FACTOR_B, multiple_b, block_size),
+        )
+        diffs = (pack(block_a) ^ pack(block_b) for block_a, block_b in blocks)
 
-def count_matches(seed_a: int, seed_b: int, pairs: int, multiple_a: int = 1, multiple_b: int = 1) -> int:
-    gen_a = generator(seed_a, FACTOR_A, multiple_a)
-    gen_b = generator(seed_b, FACTOR_B, multiple_b)
-    mask = 0xFFFF
     matches = 0
-    for _ in range(pairs):
-        if next(gen_a) & mask == next(gen_b) & mask:
-            matches += 1
-    return matches
-
-
-def solve_part1(seeds: Tuple[int, int], pairs: int = 40_000_000) -> int:
+    remaining = pairs
+    for diff in diffs:
+        lanes = min(remaining, block_size)
+        matches += lanes - mismatched_lanes(diff, lanes)
+        remaining -= lanes
+        if not remaining:
+            return matches
+    raise AssertionError("unreachable: the generators are unbounded")
+
+
+def solve_part1(
+    seeds: Tuple[int, int], pairs: int = 40_000_000, block_size: int = DEFAULT_BLOCK_SIZE
+) -> int:
     seed_a, seed_b = seeds
-    return count_matches(seed_a, seed_b, pairs)
+    return count_matches(seed_a, seed_b, pairs, block_size=block_size)
 
 
-def solve_part2(seeds: Tuple[int, int], pairs: int = 5_000_000) -> int:
+def solve_part2(
+    seeds: Tuple[int, int], pairs: int = 5_000_000, block_size: int = DEFAULT_BLOCK_SIZE
+) -> int:
     seed_a, seed_b = seeds
-    return count_matches(seed_a, seed_b, pairs, multiple_a=4, multiple_b=8)
+    return count_matches(seed_a, seed_b, pairs, multiple_a=4, multiple_b=8, block_size=block_size)
 
 
 def main() -> None:
@@ -52,14 +120,15 @@ def main() -> None:
     parser.add_argument("--part", choices={"1", "2", "both"}, default="both")
     parser.add_argument("--pairs1", type=int, default=40_000_000)
     parser.add_argument("--pairs2", type=int, default=5_000_000)
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
     args = parser.parse_args()
 
     seeds = parse(args.input_path.read_text(encoding="utf-8"))
 
     if args.part in {"1", "both"}:
-        print(f"Part 1: {solve_part1(seeds, pairs=args.pairs1)}")
+        print(f"Part 1: {solve_part1(seeds, pairs=args.pairs1, block_size=args.block_size)}")
     if args.part in {"2", "both"}:
-        print(f"Part 2: {solve_part2(seeds, pairs=args.pairs2)}")
+        print(f"Part 2: {solve_part2(seeds, pairs=args.pairs2, block_size=args.block_size)}")
 
 
 if __name__ == "__main__":
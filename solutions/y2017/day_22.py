@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-from typing import Dict, Set, Tuple
+from typing import Dict, Tuple
+
+from solutions.common.infinite_grid import BORDER, InfiniteGrid
 
 
 Grid = Dict[Tuple[int, int], int]
@@ -19,51 +21,53 @@ def parse(raw: str) -> Grid:
     return grid
 
 
-DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-
-
-def solve_part1(grid: Grid, bursts: int = 10_000) -> int:
-    infected: Set[Tuple[int, int]] = {pos for pos, state in grid.items() if state == 2}
-    x = y = 0
-    direction_index = 0
+CLEAN, WEAKENED, INFECTED, FLAGGED = range(4)
+# Per state: the state it becomes and the quarter turns (clockwise) the carrier makes.
+SIMPLE_RULES = {CLEAN: (INFECTED, 3), INFECTED: (CLEAN, 1)}
+EVOLVED_RULES = {
+    CLEAN: (WEAKENED, 3),
+    WEAKENED: (INFECTED, 0),
+    INFECTED: (FLAGGED, 1),
+    FLAGGED: (CLEAN, 2),
+}
+
+
+def run_carrier(grid: Grid, bursts: int, rules: Dict[int, Tuple[int, int]]) -> int:
+    cells_grid = InfiniteGrid.from_points(grid.items(), fill=CLEAN)
+    # Flat tables keyed by ``direction << 2 | state`` so a burst is a few indexings.
+    turn_table = [0] * 16
+    next_state = [0] * 4
+    for state, (successor, turn) in rules.items():
+        next_state[state] = successor
+        for direction in range(4):
+            turn_table[direction << 2 | state] = (direction + turn) % 4
+    infects = [int(state == INFECTED) for state in next_state]
+
+    cells = cells_grid.cells
+    moves = cells_grid.moves()
+    position = cells_grid.index(0, 0)
+    direction = 0
     infections = 0
     for _ in range(bursts):
-        if (x, y) in infected:
-            direction_index = (direction_index + 1) % 4
-            infected.remove((x, y))
-        else:
-            direction_index = (direction_index - 1) % 4
-            infected.add((x, y))
-            infections += 1
-        dx, dy = DIRECTIONS[direction_index]
-        x += dx
-        y += dy
+        state = cells[position]
+        if state == BORDER:
+            position = cells_grid.grow(position)
+            cells = cells_grid.cells
+            moves = cells_grid.moves()
+            state = cells[position]
+        direction = turn_table[direction << 2 | state]
+        cells[position] = next_state[state]
+        infections += infects[state]
+        position += moves[direction]
     return infections
 
 
+def solve_part1(grid: Grid, bursts: int = 10_000) -> int:
+    return run_carrier(grid, bursts, SIMPLE_RULES)
+
+
 def solve_part2(grid: Grid, bursts: int = 10_000_000) -> int:
-    states = grid.copy()  # 0: clean, 1: weakened, 2: infected, 3: flagged
-    x = y = 0
-    direction_index = 0
-    infections = 0
-    for _ in range(bursts):
-        state = states.get((x, y), 0)
-        if state == 0:  # clean
-            direction_index = (direction_index - 1) % 4
-            states[(x, y)] = 1
-        elif state == 1:  # weakened
-            states[(x, y)] = 2
-            infections += 1
-        elif state == 2:  # infected
-            direction_index = (direction_index + 1) % 4
-            states[(x, y)] = 3
-        elif state == 3:  # flagged
-            direction_index = (direction_index + 2) % 4
-            states[(x, y)] = 0
-        dx, dy = DIRECTIONS[direction_index]
-        x += dx
-        y += dy
-    return infections
+    return run_carrier(grid, bursts, EVOLVED_RULES)
 
 
 def main() -> None:
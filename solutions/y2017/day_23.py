@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from solutions.common import duet
+
 
 @dataclass(frozen=True)
 class Instruction:
@@ -26,33 +28,12 @@ def parse(raw: str) -> List[Instruction]:
     return instructions
 
 
-def value(operand: str, registers: Dict[str, int]) -> int:
-    if operand is None:
-        return 0
-    if operand.lstrip("-").isdigit():
-        return int(operand)
-    return registers.get(operand, 0)
-
-
 def execute(instructions: List[Instruction], initial_a: int = 0) -> Tuple[Dict[str, int], int]:
-    registers: Dict[str, int] = {"a": initial_a}
-    pointer = 0
-    mul_count = 0
-    while 0 <= pointer < len(instructions):
-        instr = instructions[pointer]
-        if instr.opcode == "set":
-            registers[instr.x] = value(instr.y, registers)
-        elif instr.opcode == "sub":
-            registers[instr.x] = registers.get(instr.x, 0) - value(instr.y, registers)
-        elif instr.opcode == "mul":
-            registers[instr.x] = registers.get(instr.x, 0) * value(instr.y, registers)
-            mul_count += 1
-        elif instr.opcode == "jnz":
-            if value(instr.x, registers) != 0:
-                pointer += value(instr.y, registers)
-                continue
-        pointer += 1
-    return registers, mul_count
+    program = [(instr.opcode, (instr.x,) if instr.y is None else (instr.x, instr.y)) for instr in instructions]
+    machine = duet.Program(duet.decode(program))
+    machine.registers[0] = initial_a
+    machine.run()
+    return machine.register_map(), machine.mul_count
 
 
 def solve_part1(instructions: List[Instruction]) -> int:
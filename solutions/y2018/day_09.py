@@ -3,7 +3,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 import re
-from collections import deque
+from array import array
 from typing import Sequence, Tuple
 
 GAME_PATTERN = re.compile(
@@ -19,17 +19,35 @@ def parse(raw: str) -> tuple[int, int]:
     return int(match.group("players")), int(match.group("marble"))
 
 
+def circle_table(last_marble: int) -> array:
+    typecode = "I" if last_marble < 1 << 32 else "Q"
+    return array(typecode, bytes(array(typecode).itemsize * (last_marble + 1)))
+
+
 def play_game(players: int, last_marble: int) -> int:
+    # ``clockwise[m]`` is the marble after ``m``; one preallocated slot per marble.
+    # Marble m is always placed right after the old successor of m - 1, and nothing is
+    # ever inserted between m - 1 and that successor afterwards. So when marble m is a
+    # multiple of 23, the marble seven steps counter-clockwise is ``clockwise[m - 5]``
+    # and the marble after it is m - 4: the walk-back is a single lookup.
     scores = [0] * players
-    circle = deque([0])
-    for marble in range(1, last_marble + 1):
-        if marble % 23 == 0:
-            circle.rotate(7)
-            scores[marble % players] += marble + circle.pop()
-            circle.rotate(-1)
-        else:
-            circle.rotate(-1)
-            circle.append(marble)
+    clockwise = circle_table(last_marble)
+    current = 0
+    for base in range(0, last_marble + 1, 23):
+        # Walk the old chain two links per placed marble.
+        after = clockwise[current]
+        for marble in range(base + 1, min(base + 22, last_marble) + 1):
+            following = clockwise[after]
+            clockwise[after] = marble
+            clockwise[marble] = following
+            after = following
+        scoring = base + 23
+        if scoring > last_marble:
+            break
+        removed = clockwise[scoring - 5]
+        clockwise[scoring - 5] = scoring - 4
+        scores[scoring % players] += scoring + removed
+        current = scoring - 4
     return max(scores)
 
 
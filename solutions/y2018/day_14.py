@@ -3,39 +3,68 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+INITIAL_CAPACITY = 1 << 20
+BATCH_SIZE = 1 << 16
+
 
 def parse(raw: str) -> str:
     return raw.strip()
 
 
+class Scoreboard:
+    """Recipe scores as single-digit bytes in a preallocated, doubling ``bytearray``."""
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        self.scores = bytearray(max(capacity, 4))
+        self.scores[0], self.scores[1] = 3, 7
+        self.size = 2
+        self.elf1, self.elf2 = 0, 1
+
+    def generate(self, count: int) -> None:
+        """Create at least ``count`` more recipes (one combination may overshoot by one)."""
+        goal = self.size + count
+        if goal + 1 >= len(self.scores):
+            self.scores.extend(bytes(max(len(self.scores), goal + 2 - len(self.scores))))
+        scores, size, elf1, elf2 = self.scores, self.size, self.elf1, self.elf2
+        while size < goal:
+            # A sum of two digits is at most 18, so the tens digit can only be 1.
+            total = scores[elf1] + scores[elf2]
+            if total >= 10:
+                scores[size] = 1
+                scores[size + 1] = total - 10
+                size += 2
+            else:
+                scores[size] = total
+                size += 1
+            elf1 += 1 + scores[elf1]
+            if elf1 >= size:
+                elf1 %= size
+            elf2 += 1 + scores[elf2]
+            if elf2 >= size:
+                elf2 %= size
+        self.size, self.elf1, self.elf2 = size, elf1, elf2
+
+    def find(self, target: bytes, batch_size: int = BATCH_SIZE) -> int:
+        # Search each fresh batch, reaching back far enough to catch a match that
+        # straddles the previous boundary.
+        searched = 0
+        while True:
+            index = self.scores.find(target, searched, self.size)
+            if index >= 0:
+                return index
+            searched = max(0, self.size - len(target) + 1)
+            self.generate(batch_size)
+
+
 def solve_part1(raw: str) -> str:
     after = int(raw)
-    scores = [3, 7]
-    elf1 = 0
-    elf2 = 1
-    while len(scores) < after + 10:
-        total = scores[elf1] + scores[elf2]
-        for digit in str(total):
-            scores.append(int(digit))
-        elf1 = (elf1 + 1 + scores[elf1]) % len(scores)
-        elf2 = (elf2 + 1 + scores[elf2]) % len(scores)
-    return "".join(str(score) for score in scores[after : after + 10])
+    board = Scoreboard(after + 12)
+    board.generate(after + 10 - board.size)
+    return "".join(map(str, board.scores[after : after + 10]))
 
 
 def solve_part2(raw: str) -> int:
-    target = [int(ch) for ch in raw]
-    target_len = len(target)
-    scores = [3, 7]
-    elf1 = 0
-    elf2 = 1
-    while True:
-        total = scores[elf1] + scores[elf2]
-        for digit in str(total):
-            scores.append(int(digit))
-            if scores[-target_len:] == target:
-                return len(scores) - target_len
-        elf1 = (elf1 + 1 + scores[elf1]) % len(scores)
-        elf2 = (elf2 + 1 + scores[elf2]) % len(scores)
+    return Scoreboard().find(bytes(int(ch) for ch in raw))
 
 
 def main() -> None:
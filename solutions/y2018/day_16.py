@@ -3,8 +3,9 @@ from __future__ import annotations
 import argparse
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Sequence
+from typing import Dict, List, Sequence
 
+from solutions.common import elfcode
 
 Register = List[int]
 Instruction = tuple[int, int, int, int]
@@ -44,102 +45,11 @@ def parse(raw: str) -> PuzzleInput:
     return PuzzleInput(samples=tuple(samples), program=tuple(program))
 
 
-def _operate(registers: Sequence[int], a: int, b: int, c: int, value: int) -> Register:
-    result = list(registers)
-    result[c] = value
-    return result
-
-
-def addr(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, registers[a] + registers[b])
-
-
-def addi(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, registers[a] + b)
-
-
-def mulr(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, registers[a] * registers[b])
-
-
-def muli(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, registers[a] * b)
-
-
-def banr(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, registers[a] & registers[b])
-
-
-def bani(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, registers[a] & b)
-
-
-def borr(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, registers[a] | registers[b])
-
-
-def bori(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, registers[a] | b)
-
-
-def setr(registers: Sequence[int], a: int, _b: int, c: int) -> Register:
-    return _operate(registers, a, _b, c, registers[a])
-
-
-def seti(registers: Sequence[int], a: int, _b: int, c: int) -> Register:
-    return _operate(registers, a, _b, c, a)
-
-
-def gtir(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, 1 if a > registers[b] else 0)
-
-
-def gtri(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, 1 if registers[a] > b else 0)
-
-
-def gtrr(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, 1 if registers[a] > registers[b] else 0)
-
-
-def eqir(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, 1 if a == registers[b] else 0)
-
-
-def eqri(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, 1 if registers[a] == b else 0)
-
-
-def eqrr(registers: Sequence[int], a: int, b: int, c: int) -> Register:
-    return _operate(registers, a, b, c, 1 if registers[a] == registers[b] else 0)
-
-
-OPERATIONS: Dict[str, Callable[[Sequence[int], int, int, int], Register]] = {
-    "addr": addr,
-    "addi": addi,
-    "mulr": mulr,
-    "muli": muli,
-    "banr": banr,
-    "bani": bani,
-    "borr": borr,
-    "bori": bori,
-    "setr": setr,
-    "seti": seti,
-    "gtir": gtir,
-    "gtri": gtri,
-    "gtrr": gtrr,
-    "eqir": eqir,
-    "eqri": eqri,
-    "eqrr": eqrr,
-}
-
-
 def matching_operations(sample: Sample) -> set[str]:
     opcode, a, b, c = sample.instruction
     matches = set()
-    for name, operation in OPERATIONS.items():
-        result = operation(sample.before, a, b, c)
-        if tuple(result) == sample.after:
+    for name in elfcode.OPCODES:
+        if tuple(elfcode.apply(sample.before, name, a, b, c)) == sample.after:
             matches.add(name)
     return matches
 
@@ -150,7 +60,7 @@ def solve_part1(puzzle: PuzzleInput) -> int:
 
 def deduce_opcode_mapping(puzzle: PuzzleInput) -> Dict[int, str]:
     possibilities: Dict[int, set[str]] = {
-        opcode: set(OPERATIONS.keys()) for opcode in range(16)
+        opcode: set(elfcode.OPCODES) for opcode in range(16)
     }
     for sample in puzzle.samples:
         opcode, _a, _b, _c = sample.instruction
@@ -188,11 +98,10 @@ def deduce_opcode_mapping(puzzle: PuzzleInput) -> Dict[int, str]:
 def execute_program(
     program: Sequence[Instruction], mapping: Dict[int, str]
 ) -> Register:
-    registers = [0, 0, 0, 0]
-    for opcode, a, b, c in program:
-        operation = OPERATIONS[mapping[opcode]]
-        registers = operation(registers, a, b, c)
-    return registers
+    named = tuple((mapping[opcode], a, b, c) for opcode, a, b, c in program)
+    machine = elfcode.Machine(named, ip_bind=None, registers=[0, 0, 0, 0])
+    machine.run()
+    return machine.registers
 
 
 def solve_part2(puzzle: PuzzleInput) -> int:
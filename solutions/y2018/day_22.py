@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import argparse
-import heapq
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, Tuple
+from typing import Iterator
+
+from solutions.common import dial
 
 Point = tuple[int, int]
 ParsedInput = tuple[int, Point]
@@ -70,48 +71,27 @@ def solve_part2(data: ParsedInput, margin: int = 50) -> int:
     depth, target = data
     erosion_level, region_type = cave_factory(depth, target)
     target_x, target_y = target
-    max_x = target_x + margin
-    max_y = target_y + margin
-
-    start_state = (0, 0, TORCH)
-    target_state = (target_x, target_y, TORCH)
-
-    heap: list[tuple[int, int, int, int]] = [(0, *start_state)]
-    best_time: Dict[tuple[int, int, int], int] = {start_state: 0}
-
-    while heap:
-        time, x, y, tool = heapq.heappop(heap)
-        state = (x, y, tool)
-        if time > best_time.get(state, float("inf")):
-            continue
-        if state == target_state:
-            return time
-
-        current_region = region_type(x, y)
-        allowed_tools = REGION_TOOLS[current_region]
-
-        for new_tool in allowed_tools:
-            if new_tool == tool:
-                continue
-            new_state = (x, y, new_tool)
-            new_time = time + 7
-            if new_time < best_time.get(new_state, float("inf")):
-                best_time[new_state] = new_time
-                heapq.heappush(heap, (new_time, x, y, new_tool))
-
+    width = target_x + margin + 1
+    height = target_y + margin + 1
+    regions = [region_type(x, y) for y in range(height) for x in range(width)]
+
+    # State id = cell * 3 + tool; switching tools costs 7 and each move costs 1.
+    def edges(state: int) -> list[tuple[int, int]]:
+        cell, tool = divmod(state, 3)
+        allowed = REGION_TOOLS[regions[cell]]
+        result = [(cell * 3 + other, 7) for other in allowed if other != tool]
+        y, x = divmod(cell, width)
         for nx, ny in neighbors((x, y)):
-            if nx > max_x or ny > max_y:
-                continue
-            next_region = region_type(nx, ny)
-            if tool not in REGION_TOOLS[next_region]:
-                continue
-            new_state = (nx, ny, tool)
-            new_time = time + 1
-            if new_time < best_time.get(new_state, float("inf")):
-                best_time[new_state] = new_time
-                heapq.heappush(heap, (new_time, nx, ny, tool))
-
-    raise RuntimeError("Unable to reach target with given constraints.")
+            if nx < width and ny < height and tool in REGION_TOOLS[regions[ny * width + nx]]:
+                result.append(((ny * width + nx) * 3 + tool, 1))
+        return result
+
+    start_state = 0 * 3 + TORCH
+    target_state = (target_y * width + target_x) * 3 + TORCH
+    dist = dial.shortest_costs(len(regions) * 3, [start_state], edges, max_weight=7, targets=[target_state])
+    if dist[target_state] == dial.UNREACHED:
+        raise RuntimeError("Unable to reach target with given constraints.")
+    return dist[target_state]
 
 
 def main() -> None:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+import os
 from pathlib import Path
-from typing import Iterable, Iterator, NamedTuple
+from typing import NamedTuple, Sequence
+
+from solutions.common import parallel
 
 DirectionIndex = int
 
@@ -51,70 +53,146 @@ def parse(raw: str) -> GuardMap:
     return GuardMap(grid=grid, start=start, direction=direction)
 
 
-def simulate(
-    guard_map: GuardMap, extra_obstruction: tuple[int, int] | None = None
-) -> tuple[set[tuple[int, int]], bool, bool]:
-    grid, (row, col), direction = guard_map
+class Floor(NamedTuple):
+    rows: int
+    cols: int
+    blocked: bytearray
+    # stops[direction][cell]: the last free cell reached walking from ``cell`` in that
+    # direction. Legs that walk off the map are stored as ``~cell`` (always negative).
+    stops: list[list[int]]
+
+
+def build_floor(grid: list[list[str]]) -> Floor:
     rows = len(grid)
     cols = len(grid[0]) if rows else 0
+    blocked = bytearray(ch == "#" for row in grid for ch in row)
+    stops: list[list[int]] = []
+    for dr, dc in DIRECTIONS:
+        table = [0] * (rows * cols)
+        # Visit cells so that the neighbour in this direction is always resolved first.
+        row_order = range(rows - 1, -1, -1) if dr > 0 else range(rows)
+        col_order = range(cols - 1, -1, -1) if dc > 0 else range(cols)
+        for r in row_order:
+            for c in col_order:
+                cell = r * cols + c
+                nr, nc = r + dr, c + dc
+                if not (0 <= nr < rows and 0 <= nc < cols):
+                    table[cell] = ~cell
+                elif blocked[nr * cols + nc]:
+                    table[cell] = cell
+                else:
+                    table[cell] = table[nr * cols + nc]
+        stops.append(table)
+    return Floor(rows, cols, blocked, stops)
+
+
+def patrol(floor: Floor, start: int, direction: DirectionIndex) -> dict[int, tuple[int, DirectionIndex]]:
+    """Walk the unmodified route, mapping each newly entered cell to the state just before it."""
+    rows, cols, blocked, _ = floor
+    steps = [dr * cols + dc for dr, dc in DIRECTIONS]
+    entries: dict[int, tuple[int, DirectionIndex]] = {start: (start, direction)}
+    turns: set[int] = set()
+    cell = start
+    while True:
+        r, c = divmod(cell, cols)
+        dr, dc = DIRECTIONS[direction]
+        if not (0 <= r + dr < rows and 0 <= c + dc < cols):
+            return entries
+        ahead = cell + steps[direction]
+        if blocked[ahead]:
+            direction = (direction + 1) % 4
+            state = cell * 4 + direction
+            if state in turns:
+                raise RuntimeError("Guard should leave the map without additional obstructions.")
+            turns.add(state)
+            continue
+        entries.setdefault(ahead, (cell, direction))
+        cell = ahead
 
-    visited_positions: set[tuple[int, int]] = {(row, col)}
-    seen_states: set[tuple[int, int, int]] = {(row, col, direction)}
 
+def loops_with(floor: Floor, cell: int, direction: DirectionIndex, obstruction: int) -> bool:
+    # Jump a whole leg at a time; only the extra obstruction can cut a leg short, and it
+    # does so exactly when it lies on the segment between the guard and the leg's end.
+    cols, stops = floor.cols, floor.stops
+    steps = [dr * cols + dc for dr, dc in DIRECTIONS]
+    block_row, block_col = divmod(obstruction, cols)
+    turns: set[int] = set()
     while True:
-        dr, dc = DIRECTIONS[direction]
-        next_row = row + dr
-        next_col = col + dc
+        stop = stops[direction][cell]
+        exits = stop < 0
+        if exits:
+            stop = ~stop
+        if direction % 2:
+            on_leg = cell // cols == block_row
+        else:
+            on_leg = cell % cols == block_col
+        if on_leg and min(cell, stop) <= obstruction <= max(cell, stop):
+            stop = obstruction - steps[direction]
+            exits = False
+        if exits:
+            return False
+        direction = (direction + 1) % 4
+        state = stop * 4 + direction
+        if state in turns:
+            return True
+        turns.add(state)
+        cell = stop
 
-        if not (0 <= next_row < rows and 0 <= next_col < cols):
-            return visited_positions, True, False  # Guard left the map.
 
-        if grid[next_row][next_col] == "#" or (
-            extra_obstruction is not None
-            and (next_row, next_col) == extra_obstruction
-        ):
-            direction = (direction + 1) % 4
-            state = (row, col, direction)
-            if state in seen_states:
-                return visited_positions, False, True
-            seen_states.add(state)
-            continue
+Candidate = tuple[int, int, DirectionIndex]
 
-        row, col = next_row, next_col
-        visited_positions.add((row, col))
-        state = (row, col, direction)
-        if state in seen_states:
-            return visited_positions, False, True
-        seen_states.add(state)
+# Below this many candidates the pool costs more than the searches it would share.
+PARALLEL_MIN_CANDIDATES = 256
 
 
-def solve_part1(guard_map: GuardMap) -> int:
-    visited, exited, looped = simulate(guard_map)
-    if looped:
-        raise RuntimeError("Unexpected loop detected during part 1 simulation.")
-    if not exited:
-        raise RuntimeError("Guard did not leave the map as expected in part 1.")
-    return len(visited)
-
-
-def solve_part2(guard_map: GuardMap) -> int:
-    visited, exited, looped = simulate(guard_map)
-    if looped:
-        raise RuntimeError("Unexpected loop detected during initial simulation.")
-    if not exited:
-        raise RuntimeError("Guard should leave the map without additional obstructions.")
-
-    start_position = guard_map.start
-    total = 0
-
-    for candidate in visited:
-        if candidate == start_position:
-            continue
-        _, _, loop_detected = simulate(guard_map, extra_obstruction=candidate)
-        if loop_detected:
-            total += 1
+def count_loops(floor: Floor, candidates: Sequence[Candidate]) -> int:
+    return sum(
+        loops_with(floor, cell, direction, obstruction)
+        for obstruction, cell, direction in candidates
+    )
+
+
+# The floor each worker process receives once, so tasks only carry their candidates.
+_worker_floor: Floor | None = None
+
+
+def _load_floor(floor: Floor) -> None:
+    global _worker_floor
+    _worker_floor = floor
+
 
-    return total
+def _count_chunk(candidates: Sequence[Candidate]) -> int:
+    assert _worker_floor is not None
+    return count_loops(_worker_floor, candidates)
+
+
+def guard_route(guard_map: GuardMap) -> tuple[Floor, dict[int, tuple[int, DirectionIndex]]]:
+    floor = build_floor(guard_map.grid)
+    row, col = guard_map.start
+    return floor, patrol(floor, row * floor.cols + col, guard_map.direction)
+
+
+def solve_part1(guard_map: GuardMap) -> int:
+    _, entries = guard_route(guard_map)
+    return len(entries)
+
+
+def solve_part2(guard_map: GuardMap, workers: int | None = None) -> int:
+    floor, entries = guard_route(guard_map)
+    row, col = guard_map.start
+    start = row * floor.cols + col
+    # The route up to an obstruction's first visit is unchanged, so each candidate is
+    # replayed from the state just before the guard would have stepped onto it.
+    candidates = [
+        (obstruction, cell, direction)
+        for obstruction, (cell, direction) in entries.items()
+        if obstruction != start
+    ]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(candidates) < PARALLEL_MIN_CANDIDATES:
+        return count_loops(floor, candidates)
+    chunk_size = max(1, -(-len(candidates) // (workers * 4)))
+    return sum(parallel.map_chunks(_count_chunk, candidates, chunk_size, workers, _load_floor, (floor,)))
 
 
 def main() -> None:
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
 import argparse
-import heapq
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Tuple
+
+from solutions.common import dial
 
 Grid = list[list[str]]
 Coordinate = tuple[int, int]
 Direction = int
-State = tuple[int, int, Direction]
 
 DIRECTIONS: list[tuple[int, int]] = [
     (1, 0),   # East
@@ -34,109 +32,76 @@ def find_char(grid: Grid, target: str) -> Coordinate:
     raise ValueError(f"Character {target!r} not found in grid.")
 
 
-def in_bounds(grid: Grid, x: int, y: int) -> bool:
-    return 0 <= y < len(grid) and 0 <= x < len(grid[0])
-
-
 def is_open(cell: str) -> bool:
     return cell in {".", "S", "E"}
 
 
-def dijkstra(grid: Grid, start: State) -> Dict[State, int]:
-    dist: Dict[State, int] = {}
-    queue: list[tuple[int, State]] = [(0, start)]
-
-    while queue:
-        cost, state = heapq.heappop(queue)
-        if state in dist:
-            continue
-        dist[state] = cost
-
-        x, y, direction = state
-
-        # Turn left
-        left_dir = (direction - 1) % 4
-        left_state: State = (x, y, left_dir)
-        if left_state not in dist:
-            heapq.heappush(queue, (cost + TURN_COST, left_state))
-
-        # Turn right
-        right_dir = (direction + 1) % 4
-        right_state: State = (x, y, right_dir)
-        if right_state not in dist:
-            heapq.heappush(queue, (cost + TURN_COST, right_state))
-
-        # Step forward
-        dx, dy = DIRECTIONS[direction]
-        nx, ny = x + dx, y + dy
-        if in_bounds(grid, nx, ny) and is_open(grid[ny][nx]):
-            forward_state: State = (nx, ny, direction)
-            if forward_state not in dist:
-                heapq.heappush(queue, (cost + STEP_COST, forward_state))
-
-    return dist
+class Maze:
+    """Reindeer states as flat ids ``cell * 4 + direction`` with forward and reverse edges."""
+
+    def __init__(self, grid: Grid) -> None:
+        self.width = len(grid[0])
+        self.state_count = len(grid) * self.width * 4
+        self.open = [is_open(cell) for row in grid for cell in row]
+        self.offsets = [dy * self.width + dx for dx, dy in DIRECTIONS]
+
+    def state(self, position: Coordinate, direction: Direction) -> int:
+        x, y = position
+        return (y * self.width + x) * 4 + direction
+
+    def _turns(self, state: int) -> list[tuple[int, int]]:
+        base, direction = state & ~3, state & 3
+        return [
+            (base | (direction + 1) % 4, TURN_COST),
+            (base | (direction - 1) % 4, TURN_COST),
+        ]
+
+    def forward(self, state: int) -> list[tuple[int, int]]:
+        edges = self._turns(state)
+        # Cells outside the grid are never open, and the border is always wall.
+        ahead = (state >> 2) + self.offsets[state & 3]
+        if 0 <= ahead < len(self.open) and self.open[ahead]:
+            edges.append((ahead << 2 | state & 3, STEP_COST))
+        return edges
+
+    def backward(self, state: int) -> list[tuple[int, int]]:
+        edges = self._turns(state)
+        behind = (state >> 2) - self.offsets[state & 3]
+        if 0 <= behind < len(self.open) and self.open[behind]:
+            edges.append((behind << 2 | state & 3, STEP_COST))
+        return edges
+
+
+def endpoints(grid: Grid, maze: Maze) -> tuple[int, list[int]]:
+    start = maze.state(find_char(grid, "S"), 0)  # Facing East
+    end_pos = find_char(grid, "E")
+    return start, [maze.state(end_pos, direction) for direction in range(4)]
 
 
 def solve_part1(grid: Grid) -> int:
-    start_pos = find_char(grid, "S")
-    end_pos = find_char(grid, "E")
-    start_state: State = (*start_pos, 0)  # Facing East
-
-    dist = dijkstra(grid, start_state)
-    best = min(dist.get((*end_pos, direction), float("inf")) for direction in range(4))
-    if best == float("inf"):
+    maze = Maze(grid)
+    start, ends = endpoints(grid, maze)
+    dist = dial.shortest_costs(maze.state_count, [start], maze.forward, TURN_COST, targets=ends)
+    best = min(dist[state] for state in ends)
+    if best == dial.UNREACHED:
         raise ValueError("Goal is unreachable.")
     return best
 
 
-def predecessors(grid: Grid, state: State, dist: Dict[State, int]) -> Iterator[State]:
-    x, y, direction = state
-    current_cost = dist[state]
-
-    # Turn predecessors
-    for delta in (-1, 1):
-        prev_dir = (direction - delta) % 4
-        prev_state = (x, y, prev_dir)
-        if prev_state in dist and dist[prev_state] + TURN_COST == current_cost:
-            yield prev_state
-
-    # Forward predecessor
-    dx, dy = DIRECTIONS[direction]
-    px, py = x - dx, y - dy
-    if in_bounds(grid, px, py) and is_open(grid[py][px]):
-        prev_state = (px, py, direction)
-        if prev_state in dist and dist[prev_state] + STEP_COST == current_cost:
-            yield prev_state
-
-
 def solve_part2(grid: Grid) -> int:
-    start_pos = find_char(grid, "S")
-    end_pos = find_char(grid, "E")
-    start_state: State = (*start_pos, 0)
-
-    dist = dijkstra(grid, start_state)
-    end_states = [
-        (*end_pos, direction)
-        for direction in range(4)
-        if (*end_pos, direction) in dist
-    ]
-    if not end_states:
+    maze = Maze(grid)
+    start, ends = endpoints(grid, maze)
+    best, from_start, to_end = dial.bidirectional_costs(
+        maze.state_count, [start], ends, maze.forward, maze.backward, max_weight=TURN_COST
+    )
+    if best == dial.UNREACHED:
         raise ValueError("Goal is unreachable.")
-
-    best_total = min(dist[state] for state in end_states)
-
-    stack: list[State] = [state for state in end_states if dist[state] == best_total]
-    seen: set[State] = set(stack)
-
-    while stack:
-        state = stack.pop()
-        for prev in predecessors(grid, state, dist):
-            if prev not in seen:
-                seen.add(prev)
-                stack.append(prev)
-
-    positions = { (x, y) for x, y, _ in seen }
-    return len(positions)
+    on_route = {
+        state >> 2
+        for state, (there, back) in enumerate(zip(from_start, to_end))
+        if there + back == best
+    }
+    return len(on_route)
 
 
 def main() -> None:
@@ -5,6 +5,8 @@ from collections import deque
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
 
+from solutions.common import connectivity
+
 Coordinate = tuple[int, int]
 
 
@@ -56,24 +58,13 @@ def solve_part1(coordinates: Sequence[Coordinate], grid_size: int = 70, byte_lim
 
 
 def solve_part2(coordinates: Sequence[Coordinate], grid_size: int = 70) -> str:
-    total_bytes = len(coordinates)
-
-    def path_exists(byte_count: int) -> bool:
-        blocked = set(coordinates[:byte_count])
-        return shortest_path_length(blocked, grid_size) is not None
-
-    low = 0
-    high = total_bytes
-    while low < high:
-        mid = (low + high) // 2
-        if path_exists(mid):
-            low = mid + 1
-        else:
-            high = mid
-
-    if low == 0:
-        raise ValueError("Path is blocked even before any bytes fall.")
-    blocking_coordinate = coordinates[low - 1]
+    side = grid_size + 1
+    index = connectivity.first_blocking_obstacle(
+        side, side, coordinates, (0, 0), (grid_size, grid_size)
+    )
+    if index is None:
+        raise ValueError("The exit stays reachable after every byte has fallen.")
+    blocking_coordinate = coordinates[index]
     return f"{blocking_coordinate[0]},{blocking_coordinate[1]}"
 
 
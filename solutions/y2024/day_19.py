@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import argparse
-from functools import lru_cache
+import os
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Sequence
+
+from solutions.common import parallel
 
 
 def parse(raw: str) -> tuple[list[str], list[str]]:
@@ -13,38 +15,98 @@ def parse(raw: str) -> tuple[list[str], list[str]]:
     return patterns, designs
 
 
-def build_prefix_map(patterns: Sequence[str]) -> Dict[str, list[str]]:
-    prefix_map: Dict[str, list[str]] = {}
-    for pattern in patterns:
-        if not pattern:
-            continue
-        prefix_map.setdefault(pattern[0], []).append(pattern)
-    return prefix_map
+class TowelTrie:
+    """Towel patterns compiled once into a trie of per-node child dicts."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.children: List[Dict[str, int]] = [{}]
+        self.terminal: List[bool] = [False]
+        self.depth = 0
+        for pattern in patterns:
+            if not pattern:
+                continue
+            node = 0
+            for char in pattern:
+                following = self.children[node].get(char)
+                if following is None:
+                    following = len(self.children)
+                    self.children[node][char] = following
+                    self.children.append({})
+                    self.terminal.append(False)
+                node = following
+            self.terminal[node] = True
+            self.depth = max(self.depth, len(pattern))
+
+    def arrangements(self, design: str) -> int:
+        """Ways to tile ``design``; ``ways[i]`` counts the tilings of ``design[i:]``."""
+        children, terminal = self.children, self.terminal
+        size = len(design)
+        ways = [0] * (size + 1)
+        ways[size] = 1
+        for start in range(size - 1, -1, -1):
+            node = 0
+            total = 0
+            for end in range(start, min(size, start + self.depth)):
+                node = children[node].get(design[end])
+                if node is None:
+                    break
+                if terminal[node]:
+                    total += ways[end + 1]
+            ways[start] = total
+        return ways[0]
 
 
 def count_arrangements(patterns: Sequence[str], design: str) -> int:
-    prefix_map = build_prefix_map(patterns)
+    return TowelTrie(patterns).arrangements(design)
+
+
+# The trie each worker process builds once, so tasks only carry their designs.
+_worker_trie: TowelTrie | None = None
+
+
+def _load_trie(patterns: Sequence[str]) -> None:
+    global _worker_trie
+    _worker_trie = TowelTrie(patterns)
+
+
+def _count_chunk(designs: Sequence[str]) -> list[int]:
+    assert _worker_trie is not None
+    return [_worker_trie.arrangements(design) for design in designs]
 
-    @lru_cache(maxsize=None)
-    def helper(remaining: str) -> int:
-        if not remaining:
-            return 1
-        total = 0
-        first_char = remaining[0]
-        for pattern in prefix_map.get(first_char, []):
-            if remaining.startswith(pattern):
-                total += helper(remaining[len(pattern):])
-        return total
 
-    return helper(design)
+def arrangement_counts(
+    patterns: Sequence[str], designs: Sequence[str], workers: int | None = None
+) -> list[int]:
+    """Arrangement count of every design, in order."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        trie = TowelTrie(patterns)
+        return [trie.arrangements(design) for design in designs]
+    chunk_size = max(1, -(-len(designs) // (workers * 4)))
+    chunks = parallel.map_chunks(_count_chunk, designs, chunk_size, workers, _load_trie, (patterns,))
+    return [count for counts in chunks for count in counts]
 
 
-def solve_part1(patterns: Sequence[str], designs: Sequence[str]) -> int:
-    return sum(1 for design in designs if count_arrangements(patterns, design) > 0)
+def solve_part1(
+    patterns: Sequence[str],
+    designs: Sequence[str],
+    workers: int | None = None,
+    counts: Sequence[int] | None = None,
+) -> int:
+    if counts is None:
+        counts = arrangement_counts(patterns, designs, workers)
+    return sum(1 for ways in counts if ways > 0)
 
 
-def solve_part2(patterns: Sequence[str], designs: Sequence[str]) -> int:
-    return sum(count_arrangements(patterns, design) for design in designs)
+def solve_part2(
+    patterns: Sequence[str],
+    designs: Sequence[str],
+    workers: int | None = None,
+    counts: Sequence[int] | None = None,
+) -> int:
+    if counts is None:
+        counts = arrangement_counts(patterns, designs, workers)
+    return sum(counts)
 
 
 def main() -> None:
@@ -55,11 +117,13 @@ def main() -> None:
 
     raw = args.input_path.read_text(encoding="utf-8")
     patterns, designs = parse(raw)
+    # Both parts read the same per-design counts, so they are computed once.
+    counts = arrangement_counts(patterns, designs)
 
     if args.part in {"1", "both"}:
-        print(f"Part 1: {solve_part1(patterns, designs)}")
+        print(f"Part 1: {solve_part1(patterns, designs, counts=counts)}")
     if args.part in {"2", "both"}:
-        print(f"Part 2: {solve_part2(patterns, designs)}")
+        print(f"Part 2: {solve_part2(patterns, designs, counts=counts)}")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import argparse
-from collections import deque
+from collections import Counter, deque
+from itertools import compress
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator
+
+from solutions.common.lanes import LANE_BYTES, lane_constant, pack, to_bytes, unpack
 
 Grid = list[str]
 Coordinate = tuple[int, int]
 
+# Lane values are biased so that every intermediate stays non-negative and below
+# 2**35: track targets carry TRACK_TARGET, wall sources WALL_SOURCE, and a pair of
+# track cells clears THRESHOLD_BIT exactly when its saving reaches min_savings.
+THRESHOLD_BIT = 34
+TRACK_TARGET = 1 << 32
+WALL_SOURCE = 1 << 33
+
 
 def parse(raw: str) -> Grid:
     return [line.strip() for line in raw.splitlines() if line.strip()]
@@ -44,48 +54,63 @@ def bfs_distances(grid: Grid, start: Coordinate) -> Dict[Coordinate, int]:
     return distances
 
 
-def count_cheats(
-    grid: Grid, cheat_limit: int, min_savings: int
-) -> int:
+def cheat_blocks(grid: Grid, cheat_limit: int, min_savings: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(lanes, block)`` per cheat offset; see ``THRESHOLD_BIT`` for the lane layout.
+
+    Every grid cell is a 64-bit lane, with rows padded by ``cheat_limit`` walls so that
+    horizontal offsets never wrap into the neighbouring row. For one offset of length
+    d, shifting the packed targets by that offset lines up every (cheat start, cheat
+    end) pair at once, and each lane holds 2**THRESHOLD_BIT + saving - min_savings when
+    both ends are track and something below 2**THRESHOLD_BIT otherwise.
+    """
     start = find_char(grid, "S")
     end = find_char(grid, "E")
-
     dist_from_start = bfs_distances(grid, start)
     dist_to_end = bfs_distances(grid, end)
-
     baseline = dist_from_start[end]
 
-    track_cells = [
-        (x, y)
-        for y, row in enumerate(grid)
-        for x, ch in enumerate(row)
-        if ch != "#"
-    ]
-
-    total = 0
-    for ax, ay in track_cells:
-        start_dist = dist_from_start.get((ax, ay))
-        if start_dist is None:
-            continue
-        for dx in range(-cheat_limit, cheat_limit + 1):
-            remaining = cheat_limit - abs(dx)
-            for dy in range(-remaining, remaining + 1):
-                bx, by = ax + dx, ay + dy
-                if (bx, by) == (ax, ay):
-                    continue
-                if not in_bounds(grid, bx, by):
-                    continue
-                if grid[by][bx] == "#":
-                    continue
-                end_dist = dist_to_end.get((bx, by))
-                if end_dist is None:
-                    continue
-                cheat_length = abs(dx) + abs(dy)
-                total_time = start_dist + cheat_length + end_dist
-                saving = baseline - total_time
-                if saving >= min_savings:
-                    total += 1
-    return total
+    stride = len(grid[0]) + cheat_limit
+    lanes = len(grid) * stride
+    sources = [WALL_SOURCE] * lanes
+    targets = [0] * lanes
+    for (x, y), steps in dist_from_start.items():
+        sources[y * stride + x] = steps
+    for (x, y), steps in dist_to_end.items():
+        targets[y * stride + x] = TRACK_TARGET + baseline - steps
+
+    target = pack(targets)
+    full = (1 << (LANE_BYTES * 8 * lanes)) - 1
+    base = lane_constant((1 << THRESHOLD_BIT) - TRACK_TARGET, lanes) - pack(sources)
+    for dy in range(-cheat_limit, cheat_limit + 1):
+        reach = cheat_limit - abs(dy)
+        for dx in range(-reach, reach + 1):
+            length = abs(dx) + abs(dy)
+            if length == 0:
+                continue
+            shift = (dy * stride + dx) * LANE_BYTES * 8
+            shifted = target >> shift if shift >= 0 else (target << -shift) & full
+            penalty = length + min_savings
+            if penalty >= 0:
+                yield lanes, shifted + base - lane_constant(penalty, lanes)
+            else:
+                yield lanes, shifted + base + lane_constant(-penalty, lanes)
+
+
+def count_cheats(grid: Grid, cheat_limit: int, min_savings: int) -> int:
+    return sum(
+        (block & lane_constant(1 << THRESHOLD_BIT, lanes)).bit_count()
+        for lanes, block in cheat_blocks(grid, cheat_limit, min_savings)
+    )
+
+
+def cheat_histogram(grid: Grid, cheat_limit: int, min_savings: int) -> Dict[int, int]:
+    """Map each saving of at least ``min_savings`` to the number of cheats achieving it."""
+    counts: Counter[int] = Counter()
+    for lanes, block in cheat_blocks(grid, cheat_limit, min_savings):
+        selected = to_bytes((block >> THRESHOLD_BIT) & lane_constant(1, lanes), lanes)[::LANE_BYTES]
+        excess = unpack(block & lane_constant((1 << THRESHOLD_BIT) - 1, lanes), lanes)
+        counts.update(compress(excess, selected))
+    return {excess + min_savings: count for excess, count in sorted(counts.items())}
 
 
 def solve_part1(grid: Grid) -> int:
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import argparse
-from collections import defaultdict
+from collections import deque
 from pathlib import Path
-from typing import Dict, Iterable, Sequence
+from typing import Iterator, Sequence
+
+from solutions.common.lanes import LANE_TYPE, lane_constant, pack, to_bytes, unpack
 
 MODULUS = 16777216
+# A change lies in -9..9, so a window of four is a base-19 number below 19**4.
+PATTERN_COUNT = 19**4
+DEFAULT_BATCH_SIZE = 512
 
 
 def next_secret(secret: int) -> int:
@@ -34,41 +39,77 @@ def price(secret: int) -> int:
     return secret % 10
 
 
-def pattern_profits(initial: int, iterations: int = 2000) -> Dict[tuple[int, int, int, int], int]:
-    secret = initial
-    prices = [price(secret)]
-    diffs: list[int] = []
-    seen: Dict[tuple[int, int, int, int], int] = {}
-
+def secret_blocks(secrets: Sequence[int], iterations: int) -> Iterator[int]:
+    """Yield every buyer's secret after 0..iterations steps, packed one buyer per lane."""
+    lanes = len(secrets)
+    keep_low_18 = lane_constant(MODULUS // 64 - 1, lanes)
+    keep_low_13 = lane_constant(MODULUS // 2048 - 1, lanes)
+    modulus_mask = lane_constant(MODULUS - 1, lanes)
+    block = pack(secrets)
+    yield block
     for _ in range(iterations):
-        secret = next_secret(secret)
-        current_price = price(secret)
-        previous_price = prices[-1]
-        prices.append(current_price)
-        diffs.append(current_price - previous_price)
-
-        if len(diffs) >= 4:
-            pattern = tuple(diffs[-4:])
-            if pattern not in seen:
-                seen[pattern] = current_price
-    return seen
+        # Masking before each left shift keeps the product inside 24 bits, which is
+        # the same as pruning afterwards; the right shift only pulls the neighbouring
+        # lane's bits into positions the mask discards.
+        block ^= (block & keep_low_18) << 6
+        block ^= (block >> 5) & modulus_mask
+        block ^= (block & keep_low_13) << 11
+        yield block
+
+
+def price_block(block: int, lanes: int) -> int:
+    # x // 10 == (x * 0xCCCCCCCD) >> 35 for any 32-bit x, and the product fits a lane.
+    tenths = ((block * 0xCCCCCCCD) >> 35) & lane_constant((1 << 29) - 1, lanes)
+    return block - 10 * tenths
+
+
+def first_sale_totals(
+    initial_secrets: Sequence[int], iterations: int = 2000, batch_size: int = DEFAULT_BATCH_SIZE
+) -> list[int]:
+    """Bananas per 4-change pattern, indexed by its base-19 code, over every buyer."""
+    # Flat lists rather than arrays: indexing them skips re-boxing the stored ints.
+    totals = [0] * PATTERN_COUNT
+    # seen[code] holds 1 + the last buyer that sold on that pattern.
+    seen = [0] * PATTERN_COUNT
+    for start in range(0, len(initial_secrets), batch_size):
+        batch = initial_secrets[start : start + batch_size]
+        lanes = len(batch)
+        nines = lane_constant(9, lanes)
+        codes = bytearray()
+        sales = bytearray()
+        changes: deque[int] = deque(maxlen=4)
+        previous = 0
+        for step, block in enumerate(secret_blocks(batch, iterations)):
+            prices = price_block(block, lanes)
+            if step:
+                changes.append(prices + nines - previous)
+            previous = prices
+            if len(changes) == 4:
+                first, second, third, fourth = changes
+                code = ((first * 19 + second) * 19 + third) * 19 + fourth
+                codes += to_bytes(code, lanes)
+                sales += to_bytes(prices, lanes)
+
+        code_view = memoryview(codes).cast(LANE_TYPE)
+        sale_view = memoryview(sales).cast(LANE_TYPE)
+        for lane in range(lanes):
+            stamp = start + lane + 1
+            for code, sale in zip(code_view[lane::lanes].tolist(), sale_view[lane::lanes].tolist()):
+                if seen[code] != stamp:
+                    seen[code] = stamp
+                    totals[code] += sale
+    return totals
 
 
 def solve_part1(initial_secrets: Sequence[int]) -> int:
-    total = 0
-    for secret in initial_secrets:
-        final_secret = generate_secret(secret, 2000)
-        total += final_secret
-    return total
+    if not initial_secrets:
+        return 0
+    *_, final = secret_blocks(initial_secrets, 2000)
+    return sum(unpack(final, len(initial_secrets)))
 
 
 def solve_part2(initial_secrets: Sequence[int]) -> int:
-    totals: Dict[tuple[int, int, int, int], int] = defaultdict(int)
-    for secret in initial_secrets:
-        profits = pattern_profits(secret)
-        for pattern, value in profits.items():
-            totals[pattern] += value
-    return max(totals.values(), default=0)
+    return max(first_sale_totals(initial_secrets))
 
 
 def main() -> None:
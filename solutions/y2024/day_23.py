@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Set, Tuple
+from typing import Dict, List, Set
+
+from solutions.common.bitgraph import BitGraph
 
 
 def parse(raw: str) -> Dict[str, Set[str]]:
@@ -18,42 +20,14 @@ def parse(raw: str) -> Dict[str, Set[str]]:
 
 
 def count_triangles_with_t(graph: Dict[str, Set[str]]) -> int:
-    count = 0
-    vertices = sorted(graph.keys())
-    for i, a in enumerate(vertices):
-        neighbors_a = graph[a]
-        for b in sorted(neighbors_a):
-            if b <= a:
-                continue
-            common = neighbors_a & graph[b]
-            for c in sorted(common):
-                if c <= b:
-                    continue
-                if any(name.startswith("t") for name in (a, b, c)):
-                    count += 1
-    return count
+    network = BitGraph.from_adjacency(graph)
+    without_t = network.select(lambda name: not name.startswith("t"))
+    return network.count_triangles() - network.count_triangles(within=without_t)
 
 
 def largest_clique(graph: Dict[str, Set[str]]) -> List[str]:
-    best_clique: List[str] = []
-
-    def bronk(r: Set[str], p: Set[str], x: Set[str]) -> None:
-        nonlocal best_clique
-        if not p and not x:
-            if len(r) > len(best_clique):
-                best_clique = sorted(r)
-            return
-        # Pivot strategy
-        if p or x:
-            u = max((p | x), key=lambda vertex: len(graph[vertex]))
-            for v in list(p - graph[u]):
-                bronk(r | {v}, p & graph[v], x & graph[v])
-                p.remove(v)
-                x.add(v)
-
-    vertices = set(graph.keys())
-    bronk(set(), vertices, set())
-    return best_clique
+    network = BitGraph.from_adjacency(graph)
+    return sorted(network.names[node] for node in network.maximum_clique())
 
 
 def solve_part1(graph: Dict[str, Set[str]]) -> int:
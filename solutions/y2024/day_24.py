@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import random
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from pathlib import Path
@@ -210,26 +211,201 @@ def deduce_swaps(base_values: Dict[str, int], gates: Sequence[Gate]) -> tuple[li
     return unique_swaps, output_remap
 
 
+OPERATIONS = {"AND": 0, "OR": 1, "XOR": 2}
+
+
+class Circuit:
+    """Netlist compiled to integer wire slots, simulated on bit-parallel test vectors.
+
+    Every wire value is a Python int whose bit k is that wire's value in test vector
+    k, so one pass through the gates checks ``lanes`` additions at once. Swapping two
+    gate outputs re-evaluates only the gates downstream of the swapped wires.
+    """
+
+    def __init__(self, input_wires: Iterable[str], gates: Sequence[Gate]) -> None:
+        self.names: list[str] = sorted(set(input_wires))
+        self.names += sorted({gate.output for gate in gates} - set(self.names))
+        self.names += sorted({w for g in gates for w in (g.left, g.right)} - set(self.names))
+        self.slots = {name: slot for slot, name in enumerate(self.names)}
+        self.ops = [OPERATIONS[gate.op] for gate in gates]
+        self.left = [self.slots[gate.left] for gate in gates]
+        self.right = [self.slots[gate.right] for gate in gates]
+        self.output = [self.slots[gate.output] for gate in gates]
+        self.driver = [-1] * len(self.names)
+        self.readers: list[list[int]] = [[] for _ in self.names]
+        for index in range(len(gates)):
+            self.driver[self.output[index]] = index
+            self.readers[self.left[index]].append(index)
+            self.readers[self.right[index]].append(index)
+        self.values = [0] * len(self.names)
+        self.mask = 0
+
+    def bus(self, prefix: str) -> list[int]:
+        return [self.slots[name] for name in self.names if name.startswith(prefix) and name[1:].isdigit()]
+
+    def _apply(self, gate: int) -> None:
+        values, op = self.values, self.ops[gate]
+        left, right = values[self.left[gate]], values[self.right[gate]]
+        if op == 0:
+            values[self.output[gate]] = left & right
+        elif op == 1:
+            values[self.output[gate]] = left | right
+        else:
+            values[self.output[gate]] = left ^ right
+
+    def _ordered(self, gates: Iterable[int]) -> list[int] | None:
+        # Kahn's algorithm restricted to ``gates``; None when the wiring has a cycle.
+        gates = set(gates)
+        indegree = {
+            gate: sum(self.driver[wire] in gates for wire in (self.left[gate], self.right[gate]))
+            for gate in gates
+        }
+        ready = [gate for gate, degree in indegree.items() if degree == 0]
+        order: list[int] = []
+        while ready:
+            gate = ready.pop()
+            order.append(gate)
+            for reader in self.readers[self.output[gate]]:
+                if reader in indegree:
+                    indegree[reader] -= 1
+                    if indegree[reader] == 0:
+                        ready.append(reader)
+        return order if len(order) == len(gates) else None
+
+    def load(self, lanes: dict[int, int], width: int) -> None:
+        """Set the input slots to the given lane words and evaluate every gate."""
+        self.mask = (1 << width) - 1
+        for slot, word in lanes.items():
+            self.values[slot] = word & self.mask
+        order = self._ordered(range(len(self.ops)))
+        if order is None:
+            raise ValueError("Cycle detected in gate configuration.")
+        for gate in order:
+            self._apply(gate)
+
+    def cone(self, wires: Iterable[int]) -> set[int]:
+        seen: set[int] = set()
+        pending = [reader for wire in wires for reader in self.readers[wire]]
+        while pending:
+            gate = pending.pop()
+            if gate not in seen:
+                seen.add(gate)
+                pending.extend(self.readers[self.output[gate]])
+        return seen
+
+    def swap(self, wire_a: int, wire_b: int) -> bool:
+        """Exchange the drivers of two wires; refuse (and undo) swaps that form a cycle."""
+        for wire in (wire_a, wire_b):
+            if self.driver[wire] < 0:
+                raise ValueError(f"Wire {self.names[wire]} has no driving gate")
+        gate_a, gate_b = self.driver[wire_a], self.driver[wire_b]
+        self._exchange(wire_a, wire_b, gate_a, gate_b)
+        order = self._ordered(self.cone((wire_a, wire_b)))
+        if order is None:
+            self._exchange(wire_a, wire_b, gate_b, gate_a)
+            return False
+        for gate in order:
+            self._apply(gate)
+        return True
+
+    def _exchange(self, wire_a: int, wire_b: int, gate_a: int, gate_b: int) -> None:
+        self.output[gate_a], self.output[gate_b] = wire_b, wire_a
+        self.driver[wire_a], self.driver[wire_b] = gate_b, gate_a
+        self.values[wire_a], self.values[wire_b] = self.values[wire_b], self.values[wire_a]
+
+
+def load_random_additions(circuit: Circuit, rng: random.Random, lanes: int = 64) -> list[int]:
+    """Feed ``lanes`` random (x, y) pairs and return the expected lane word per z bit."""
+    x_bus, y_bus, z_bus = circuit.bus("x"), circuit.bus("y"), circuit.bus("z")
+    words = {slot: rng.getrandbits(lanes) for slot in x_bus + y_bus}
+    circuit.load(words, lanes)
+    expected: list[int] = []
+    carry = 0
+    for x_slot, y_slot in zip(x_bus, y_bus):
+        x_word, y_word = words[x_slot], words[y_slot]
+        expected.append(x_word ^ y_word ^ carry)
+        carry = (x_word & y_word) | (carry & (x_word ^ y_word))
+    expected.append(carry)
+    return expected + [0] * (len(z_bus) - len(expected))
+
+
+def wrong_bits(circuit: Circuit, expected: Sequence[int]) -> list[int]:
+    values = circuit.values
+    return [bit for bit, slot in enumerate(circuit.bus("z")) if values[slot] != expected[bit]]
+
+
+def search_swaps(
+    base_values: Dict[str, int], gates: Sequence[Gate], max_swaps: int = 4, seed: int = 2024
+) -> list[tuple[str, str]]:
+    """Repair the adder greedily by simulation rather than by its expected structure.
+
+    At each round the candidates are the gates feeding the lowest wrong output bit;
+    every swap of one of them with any other gate output is tried incrementally, and
+    the swap that pushes the first wrong bit furthest up (then leaves the fewest wrong
+    bits) is kept.
+    """
+    circuit = Circuit(base_values, gates)
+    expected = load_random_additions(circuit, random.Random(seed))
+    z_bus = circuit.bus("z")
+    drivable = [wire for wire in range(len(circuit.names)) if circuit.driver[wire] >= 0]
+    swaps: list[tuple[str, str]] = []
+    while (errors := wrong_bits(circuit, expected)) and len(swaps) < max_swaps:
+        first = errors[0]
+        suspects = {z_bus[first]} | {
+            circuit.output[gate] for gate in _fan_in(circuit, z_bus[first], depth=3)
+        }
+        best: tuple[tuple[int, int], int, int] | None = None
+        for wire_a in suspects:
+            for wire_b in drivable:
+                if wire_b == wire_a or not circuit.swap(wire_a, wire_b):
+                    continue
+                remaining = wrong_bits(circuit, expected)
+                score = (remaining[0] if remaining else len(z_bus), -len(remaining))
+                if best is None or score > best[0]:
+                    best = (score, wire_a, wire_b)
+                circuit.swap(wire_a, wire_b)
+        if best is None or best[0][0] <= first:
+            raise ValueError(f"No single swap repairs output bit {first}")
+        _, wire_a, wire_b = best
+        circuit.swap(wire_a, wire_b)
+        swaps.append(tuple(sorted((circuit.names[wire_a], circuit.names[wire_b]))))
+    if wrong_bits(circuit, expected):
+        raise ValueError("Circuit is still not an adder after the allowed swaps.")
+    return sorted(swaps)
+
+
+def _fan_in(circuit: Circuit, wire: int, depth: int) -> set[int]:
+    gates: set[int] = set()
+    frontier = [wire]
+    for _ in range(depth):
+        drivers = [circuit.driver[w] for w in frontier if circuit.driver[w] >= 0]
+        gates.update(drivers)
+        frontier = [w for gate in drivers for w in (circuit.left[gate], circuit.right[gate])]
+    return gates
+
+
+def verify_adder(
+    base_values: Dict[str, int], gates: Sequence[Gate], swaps: Iterable[tuple[str, str]], seed: int = 2024
+) -> bool:
+    circuit = Circuit(base_values, gates)
+    expected = load_random_additions(circuit, random.Random(seed))
+    for wire_a, wire_b in swaps:
+        for name in (wire_a, wire_b):
+            if name not in circuit.slots:
+                raise ValueError(f"Unknown wire {name}")
+        if not circuit.swap(circuit.slots[wire_a], circuit.slots[wire_b]):
+            return False
+    return not wrong_bits(circuit, expected)
+
+
 def solve_part2(raw: str) -> str:
     base_values, gates = parse(raw)
-    swap_pairs, output_remap = deduce_swaps(base_values, gates)
-
-    # Optional verification: ensure circuit now behaves as adder for random samples.
-    order = topological_order(gates, base_values.keys())
-    x_wires = sorted([wire for wire in base_values if wire.startswith("x")])
-    y_wires = sorted([wire for wire in base_values if wire.startswith("y")])
-
-    import random
-
-    for _ in range(40):
-        x = random.randrange(1 << len(x_wires))
-        y = random.randrange(1 << len(y_wires))
-        overrides = {wire: (x >> idx) & 1 for idx, wire in enumerate(x_wires)}
-        overrides.update({wire: (y >> idx) & 1 for idx, wire in enumerate(y_wires)})
-        values = evaluate(base_values, gates, order, output_remap=output_remap, overrides=overrides)
-        expected = x + y
-        if z_value(values) != expected:
-            raise RuntimeError("Swap deduction verification failed.")
+    try:
+        swap_pairs, _ = deduce_swaps(base_values, gates)
+    except (KeyError, ValueError):
+        swap_pairs = search_swaps(base_values, gates)
+    if not verify_adder(base_values, gates, swap_pairs):
+        raise RuntimeError("Swap deduction verification failed.")
 
     wires = sorted({wire for pair in swap_pairs for wire in pair})
     return ",".join(wires)
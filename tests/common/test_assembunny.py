@@ -0,0 +1,114 @@
+import math
+
+import pytest
+
+from solutions.common import assembunny
+
+MULTIPLY = [
+    ("cpy", ("7", "d")),
+    ("cpy", ("6", "b")),
+    ("cpy", ("b", "c")),
+    ("inc", ("a",)),
+    ("dec", ("c",)),
+    ("jnz", ("c", "-2")),
+    ("dec", ("d",)),
+    ("jnz", ("d", "-5")),
+]
+
+# The factorial core of the usual 2016 day 23 program: tgl rewrites the tail on the fly.
+FACTORIAL_SOURCE = """\
+cpy a b
+dec b
+cpy a d
+cpy 0 a
+cpy b c
+inc a
+dec c
+jnz c -2
+dec d
+jnz d -5
+dec b
+cpy b c
+cpy c d
+dec d
+inc c
+jnz d -2
+tgl c
+cpy -16 c
+jnz 1 c
+cpy 73 c
+jnz 82 d
+inc a
+inc d
+jnz d -2
+inc c
+jnz c -5"""
+FACTORIAL = [(line.split()[0], tuple(line.split()[1:])) for line in FACTORIAL_SOURCE.splitlines()]
+
+
+def interpret(program: list[tuple[str, tuple[str, ...]]], initial: dict[str, int]) -> dict[str, int]:
+    registers = {name: 0 for name in assembunny.REGISTERS}
+    registers.update(initial)
+    code = [list(item) for item in program]
+
+    def read(operand: str) -> int:
+        return registers[operand] if operand in registers else int(operand)
+
+    pc = 0
+    while 0 <= pc < len(code):
+        opcode, args = code[pc]
+        if opcode == "cpy":
+            if args[1] in registers:
+                registers[args[1]] = read(args[0])
+        elif opcode == "inc":
+            registers[args[0]] += 1
+        elif opcode == "dec":
+            registers[args[0]] -= 1
+        elif opcode == "jnz" and read(args[0]):
+            pc += read(args[1])
+            continue
+        elif opcode == "tgl":
+            target = pc + read(args[0])
+            if 0 <= target < len(code):
+                toggled = {"inc": "dec", "dec": "inc", "tgl": "inc", "jnz": "cpy", "cpy": "jnz"}
+                code[target][0] = toggled[code[target][0]]
+        pc += 1
+    return registers
+
+
+def test_multiply_loop_matches_plain_interpretation() -> None:
+    machine = assembunny.Machine(MULTIPLY, {"a": 5})
+    assert machine.run() == interpret(MULTIPLY, {"a": 5}) == {"a": 47, "b": 6, "c": 0, "d": 0}
+    assert machine.steps < 10
+
+
+def test_add_loop_leaves_non_positive_counters_to_the_interpreter() -> None:
+    code = assembunny.decode([("inc", ("b",)), ("dec", ("c",)), ("jnz", ("c", "-2"))])
+    add = assembunny._add_loop(code, 0)
+    assert add is not None
+    for counter in (0, -3):
+        registers = [0, 5, counter, 0]
+        assert add(registers) is None
+        assert registers == [0, 5, counter, 0]
+    registers = [0, 5, 4, 0]
+    assert add(registers) == 3 and registers == [0, 9, 0, 0]
+
+
+def test_toggles_invalidate_stale_superinstructions() -> None:
+    assert assembunny.Machine(FACTORIAL, {"a": 7}).run() == interpret(FACTORIAL, {"a": 7})
+    assert assembunny.Machine(FACTORIAL, {"a": 12}).run()["a"] == math.factorial(12) + 73 * 82
+
+
+def test_outputs_resume_after_each_signal() -> None:
+    program = [("out", ("a",)), ("inc", ("a",)), ("jnz", ("1", "-2"))]
+    machine = assembunny.Machine(program)
+    signals = machine.outputs()
+    assert [next(signals) for _ in range(3)] == [0, 1, 2]
+    signals.close()
+    assert machine.state() == (1, (2, 0, 0, 0), 0)
+    assert machine.run(max_steps=4)["a"] == 4
+
+
+def test_unknown_opcode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        assembunny.decode([("mul", ("a", "b"))])
@@ -0,0 +1,18 @@
+from solutions.common import bitgraph
+
+
+def test_bitgraph_triangles_and_clique() -> None:
+    # A 4-clique a-b-c-d with a pendant triangle c-e-f.
+    edges = [(x, y) for i, x in enumerate("abcd") for y in "abcd"[i + 1 :]]
+    edges += [("c", "e"), ("e", "f"), ("c", "f")]
+    graph = bitgraph.BitGraph.from_edges(edges)
+    assert graph.count_triangles() == 5
+    assert graph.count_triangles(within=graph.select(lambda name: name != "a")) == 2
+    assert sorted(graph.names[node] for node in graph.maximum_clique()) == ["a", "b", "c", "d"]
+
+
+def test_bitgraph_degeneracy_order_peels_low_degree_first() -> None:
+    graph = bitgraph.BitGraph.from_adjacency({"hub": {"x", "y", "z"}, "x": {"hub"}, "y": {"hub"}, "z": {"hub"}})
+    order = [graph.names[node] for node in graph.degeneracy_order()]
+    assert order.index("hub") >= 2
+    assert list(bitgraph.bits(0b10110)) == [1, 2, 4]
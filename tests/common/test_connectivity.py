@@ -0,0 +1,16 @@
+from solutions.common import connectivity
+
+
+def test_union_find_merges_by_size() -> None:
+    sets = connectivity.UnionFind(5)
+    sets.union(0, 1)
+    sets.union(2, 1)
+    assert sets.find(0) == sets.find(2) != sets.find(3)
+    assert sets.size[sets.find(0)] == 3
+
+
+def test_first_blocking_obstacle_handles_repeats_and_open_grids() -> None:
+    wall = [(1, 0), (1, 2), (1, 1)]
+    assert connectivity.first_blocking_obstacle(3, 3, wall, (0, 0), (2, 2)) == 2
+    assert connectivity.first_blocking_obstacle(3, 3, wall + [(1, 1)], (0, 0), (2, 2)) == 2
+    assert connectivity.first_blocking_obstacle(3, 3, wall[:2], (0, 0), (2, 2)) is None
@@ -0,0 +1,23 @@
+from solutions.common import dial
+
+# 0 -1-> 1 -1-> 2 -1-> 3, plus a direct 0 -3-> 3 and a dead end 3 -5-> 4.
+EDGES = {0: [(1, 1), (3, 3)], 1: [(2, 1)], 2: [(3, 1)], 3: [(4, 5)], 4: []}
+REVERSE = {0: [], 1: [(0, 1)], 2: [(1, 1)], 3: [(2, 1), (0, 3)], 4: [(3, 5)]}
+
+
+def test_bucket_queue_matches_weighted_costs() -> None:
+    assert dial.shortest_costs(5, [0], EDGES.__getitem__, max_weight=5) == [0, 1, 2, 3, 8]
+
+
+def test_target_bounds_the_search() -> None:
+    dist = dial.shortest_costs(5, [0], EDGES.__getitem__, max_weight=5, targets=[3])
+    assert dist[:4] == [0, 1, 2, 3]
+    assert dist[4] == dial.UNREACHED
+
+
+def test_bidirectional_marks_every_cheapest_route() -> None:
+    best, there, back = dial.bidirectional_costs(
+        5, [0], [3], EDGES.__getitem__, REVERSE.__getitem__, max_weight=5
+    )
+    assert best == 3
+    assert [state for state in range(5) if there[state] + back[state] == best] == [0, 1, 2, 3]
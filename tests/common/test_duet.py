@@ -0,0 +1,39 @@
+from solutions.common import duet
+from solutions.y2017 import day_18, day_23
+
+# Program 0 emits 2000 values and takes one back; every other program relays them onwards.
+RELAY = """\
+set i 2000
+jgz p 5
+snd i
+add i -1
+jgz i -2
+jgz 1 4
+rcv a
+snd a
+add i -1
+jgz i -3
+rcv a
+"""
+
+
+def test_ring_of_programs_batches_messages_until_deadlock() -> None:
+    code = duet.decode(day_18.parse(RELAY))
+    programs = [duet.Program(code, pid) for pid in range(4)]
+    assert duet.run_network(programs) is True
+    assert [program.sent for program in programs] == [2000, 2000, 2000, 2000]
+    assert [len(program.inbox) for program in programs] == [1999, 0, 0, 0]
+
+
+def test_network_reports_clean_halt() -> None:
+    code = duet.decode(day_18.parse("snd p\nrcv a\n"))
+    programs = [duet.Program(code, pid) for pid in range(3)]
+    assert duet.run_network(programs) is False
+    assert [program.registers[0] for program in programs] == [2, 0, 1]
+
+
+def test_decoder_is_shared_with_the_coprocessor() -> None:
+    program = day_23.parse("set b 3\nmul b b\nsub b 1\njnz b -1\nmul a 0\n")
+    registers, mul_count = day_23.execute(program, initial_a=5)
+    assert registers == {"a": 0, "b": 0}
+    assert mul_count == 2
@@ -0,0 +1,163 @@
+from itertools import islice
+from textwrap import dedent
+
+from solutions.common import elfcode
+from solutions.y2018 import day_19, day_21
+
+DIVISOR_PROGRAM = dedent(
+    """\
+    #ip 3
+    addi 3 16 3
+    seti 1 8 1
+    seti 1 3 4
+    mulr 1 4 5
+    eqrr 5 2 5
+    addr 5 3 3
+    addi 3 1 3
+    addr 1 0 0
+    addi 4 1 4
+    gtrr 4 2 5
+    addr 3 5 3
+    seti 2 6 3
+    addi 1 1 1
+    gtrr 1 2 5
+    addr 5 3 3
+    seti 1 1 3
+    mulr 3 3 3
+    addi 2 2 2
+    mulr 2 2 2
+    mulr 3 2 2
+    muli 2 0 2
+    addi 5 4 5
+    mulr 5 3 5
+    addi 5 16 5
+    addr 2 5 2
+    addr 3 0 3
+    seti 0 0 3
+    setr 3 4 5
+    mulr 5 3 5
+    addr 3 5 5
+    mulr 3 5 5
+    muli 5 14 5
+    mulr 5 3 5
+    addr 2 5 2
+    seti 0 4 0
+    seti 0 3 3
+    """
+)
+
+BYTE_SHIFT_PROGRAM = dedent(
+    """\
+    #ip 4
+    seti 123 0 2
+    bani 2 456 2
+    eqri 2 72 2
+    addr 2 4 4
+    seti 0 0 4
+    seti 0 0 2
+    bori 2 65536 5
+    seti 5234604 6 2
+    bani 5 255 3
+    addr 2 3 2
+    bani 2 16777215 2
+    muli 2 65899 2
+    bani 2 16777215 2
+    gtir 256 5 3
+    addr 3 4 4
+    addi 4 1 4
+    seti 27 2 4
+    seti 0 0 3
+    addi 3 1 1
+    muli 1 256 1
+    gtrr 1 5 1
+    addr 1 4 4
+    addi 4 1 4
+    seti 25 3 4
+    addi 3 1 3
+    seti 17 1 4
+    setr 3 2 5
+    seti 7 4 4
+    eqrr 2 0 3
+    addr 3 4 4
+    seti 5 8 4
+    """
+)
+
+
+def interpret(machine: elfcode.Machine) -> elfcode.Machine:
+    for _ in machine.trace():
+        pass
+    return machine
+
+
+def test_compiled_idioms_match_interpreter() -> None:
+    ip_bind, program = day_19.parse(DIVISOR_PROGRAM)
+    compiled = elfcode.Machine(program, ip_bind)
+    compiled.run()
+    plain = elfcode.Machine(program, ip_bind)
+    plain.run(idioms=False)
+    reference = interpret(elfcode.Machine(program, ip_bind))
+
+    assert compiled.registers == plain.registers == reference.registers
+    assert compiled.steps == plain.steps == reference.steps
+    assert compiled.registers[0] == elfcode.divisor_sum(compiled.registers[2])
+
+
+def test_divisor_idiom_handles_large_targets() -> None:
+    ip_bind, program = day_19.parse(DIVISOR_PROGRAM)
+    machine = elfcode.Machine(program, ip_bind, [1, 0, 0, 0, 0, 0])
+    machine.run()
+    assert machine.registers[2] == 10550504
+    assert machine.registers[0] == elfcode.divisor_sum(10550504) == 19819620
+
+
+def test_breakpoints_match_interpreted_trace() -> None:
+    ip_bind, program = day_21.parse(BYTE_SHIFT_PROGRAM)
+    compiled = elfcode.Machine(program, ip_bind)
+    values = list(islice(compiled.values_at(28, 2), 4))
+
+    reference = elfcode.Machine(program, ip_bind)
+    expected = []
+    for _ in reference.trace():
+        if reference.ip == 28:
+            expected.append(reference.registers[2])
+            if len(expected) == 4:
+                break
+
+    assert values == expected
+    assert compiled.steps == reference.steps
+    assert compiled.registers == reference.registers
+
+
+def test_apply_and_compiled_expressions_agree() -> None:
+    registers = [7, 3, 12, 5]
+    for name in elfcode.OPCODES:
+        machine = elfcode.Machine(((name, 2, 1, 0),), registers=list(registers))
+        machine.run()
+        assert machine.registers == elfcode.apply(registers, name, 2, 1, 0)
+
+
+def test_bitwise_jumps_on_the_ip_register_match_interpreter() -> None:
+    for name in ("borr", "bori", "banr", "bani"):
+        for a, b in ((4, 0), (0, 4), (1, 3)):
+            # Low bits of the result pick how far to jump, so a misparsed ``+ 1`` shows.
+            program = ((name, a, b, 4), ("addi", 1, 2, 1), ("addi", 2, 3, 2), ("seti", 9, 0, 3))
+            for start in ([6, 3, 2, 1, 0, 5], [1, 7, 1, 2, 0, 4], [3, 0, 0, 0, 0, 0]):
+                compiled = elfcode.Machine(program, 4, list(start))
+                compiled.run()
+                reference = interpret(elfcode.Machine(program, 4, list(start)))
+                assert compiled.registers == reference.registers, (name, a, b, start)
+                assert compiled.steps == reference.steps
+
+
+def test_step_limit_is_exact() -> None:
+    ip_bind, program = day_19.parse(DIVISOR_PROGRAM)
+    for limit in (0, 1, 5, 17, 40, 1000):
+        compiled = elfcode.Machine(program, ip_bind)
+        compiled.run(limit=limit)
+        reference = elfcode.Machine(program, ip_bind)
+        for _ in reference.trace(limit):
+            pass
+        assert compiled.steps == reference.steps == limit
+        assert (compiled.ip, compiled.registers) == (reference.ip, reference.registers)
+        assert day_19.run_program(ip_bind, program, [0] * 6, step_limit=limit) == reference.registers
@@ -0,0 +1,25 @@
+from solutions.common.infinite_grid import BORDER, InfiniteGrid
+
+
+def test_points_survive_repeated_growth() -> None:
+    grid = InfiniteGrid.from_points([((-1, 0), 2), ((1, 1), 3)])
+    grid[40, -25] = 1
+    assert grid.width >= 42 and grid.height >= 27
+    assert grid[-1, 0] == 2
+    assert grid[1, 1] == 3
+    assert grid[40, -25] == 1
+    assert grid[1000, 1000] == 0
+    assert grid.count(2) == 1
+
+
+def test_walker_detects_border_and_keeps_its_place() -> None:
+    grid = InfiniteGrid(0, 0, 2, 2)
+    grid[1, 0] = 7
+    position = grid.index(1, 0)
+    right = grid.moves()[1]
+    position += right
+    assert grid.cells[position] == BORDER
+    position = grid.grow(position)
+    assert grid.coords(position) == (2, 0)
+    assert grid.cells[position - grid.moves()[1]] == 7
+    assert sorted(point for point, value in grid if value) == [(1, 0)]
@@ -0,0 +1,9 @@
+from solutions.common import lanes
+
+
+def test_pack_round_trip_and_lane_constants() -> None:
+    values = [0, 1, 2**40, 2**64 - 1]
+    block = lanes.pack(values)
+    assert list(lanes.unpack(block, len(values))) == values
+    assert list(lanes.unpack(lanes.lane_constant(7, 3), 3)) == [7, 7, 7]
+    assert lanes.to_bytes(lanes.pack([1]), 2) == bytes([1]) + bytes(15)
@@ -0,0 +1,27 @@
+import hashlib
+from itertools import islice
+
+from solutions.common import md5_mining
+
+
+def test_scan_chunk_matches_hexdigest_prefix() -> None:
+    expected = [
+        index
+        for index in range(20_000)
+        if hashlib.md5(f"abc{index}".encode()).hexdigest().startswith("000")
+    ]
+    assert [index for index, _ in md5_mining.scan_chunk("abc", 3, 0, 20_000)] == expected
+
+
+def test_parallel_mining_keeps_index_order() -> None:
+    serial = list(islice(md5_mining.mine("abc", 3, chunk_size=1_000, workers=1), 12))
+    parallel = list(islice(md5_mining.mine("abc", 3, chunk_size=1_000, workers=3), 12))
+    assert parallel == serial
+    assert [index for index, _ in serial] == sorted(index for index, _ in serial)
+
+
+def test_nibble_and_prefix_digest() -> None:
+    digest = md5_mining.md5_digest("hijkl", "D")
+    assert digest == hashlib.md5(b"hijklD").digest()
+    hexdigest = digest.hex()
+    assert [md5_mining.nibble(digest, i) for i in range(8)] == [int(c, 16) for c in hexdigest[:8]]
@@ -0,0 +1,37 @@
+from contextlib import closing
+from itertools import islice
+
+from solutions.common import parallel
+
+
+def squares(offset: int, lo: int, hi: int) -> list[int]:
+    return [offset + value * value for value in range(lo, hi)]
+
+
+def test_ordered_chunks_yields_consecutive_ranges_in_order() -> None:
+    for workers in (1, 3):
+        chunks = parallel.ordered_chunks(squares, (1,), 5, 4, workers)
+        with closing(chunks):
+            assert list(islice(chunks, 3)) == [
+                [26, 37, 50, 65],
+                [82, 101, 122, 145],
+                [170, 197, 226, 257],
+            ]
+
+
+_offset = 0
+
+
+def set_offset(offset: int) -> None:
+    global _offset
+    _offset = offset
+
+
+def shifted(chunk: list[int]) -> list[int]:
+    return [_offset + value for value in chunk]
+
+
+def test_map_chunks_ships_slices_to_initialised_workers() -> None:
+    for workers in (1, 2):
+        chunks = parallel.map_chunks(shifted, list(range(7)), 3, workers, set_offset, (10,))
+        assert list(chunks) == [[10, 11, 12], [13, 14, 15], [16]]
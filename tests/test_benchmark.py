@@ -0,0 +1,40 @@
+from pathlib import Path
+
+from solutions import benchmark
+from solutions.runner import DaySpec
+
+
+def stats(median: float) -> dict[str, float]:
+    return {"median": median, "p95": median}
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 21)]
+    assert benchmark.percentile(values, 95) == 19.0
+    assert benchmark.percentile([3.0], 95) == 3.0
+
+
+def test_bench_day_times_every_stage(tmp_path: Path) -> None:
+    path = DaySpec(2015, 1).input_path(tmp_path)
+    path.parent.mkdir(parents=True)
+    path.write_text("()())", encoding="utf-8")
+
+    bench = benchmark.bench_day(DaySpec(2015, 1), tmp_path, samples=3)
+
+    assert bench.error is None
+    assert [len(bench.samples[stage]) for stage in benchmark.STAGES] == [6, 3, 3]
+    assert set(bench.summary()) == set(benchmark.STAGES)
+
+
+def test_find_regressions_against_latest_history(tmp_path: Path) -> None:
+    history_path = tmp_path / "history.jsonl"
+    benchmark.append_history(history_path, {"days": {"2015/01": {"part1": stats(1.0)}}})
+    benchmark.append_history(history_path, {"days": {"2015/01": {"part1": stats(0.1)}}})
+    baseline = benchmark.baseline_from(benchmark.load_history(history_path))
+
+    record = {"days": {"2015/01": {"part1": stats(0.2), "part2": stats(9.0)}}}
+    regressions = benchmark.find_regressions(record, baseline, threshold=1.5)
+
+    assert [(r.key, r.stage) for r in regressions] == [("2015/01", "part1")]
+    assert regressions[0].ratio == 2.0
+    assert benchmark.find_regressions(record, baseline, threshold=2.5) == []
@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+
+from solutions import cache, runner
+from solutions.cache import AnswerCache
+from solutions.runner import DaySpec
+from solutions.y2017 import day_10, day_14
+
+
+def test_answer_is_computed_once_per_input(tmp_path: Path) -> None:
+    answers = AnswerCache(tmp_path)
+    calls = []
+
+    def compute() -> int:
+        calls.append(1)
+        return 42
+
+    assert answers.answer(day_10, "3,4,1,5", "part1", compute) == "42"
+    assert answers.answer(day_10, "3,4,1,5", "part1", compute) == "42"
+    assert len(calls) == 1
+    answers.answer(day_10, "3,4,1,6", "part1", compute)
+    answers.answer(day_10, "3,4,1,5", "part2", compute)
+    assert len(calls) == 3
+
+
+def test_source_hash_covers_solution_dependencies() -> None:
+    assert cache.source_hash(day_14) != cache.source_hash(day_10)
+    assert day_10.__name__ in {dep.__name__ for dep in cache._solution_dependencies(day_14)}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    answers = AnswerCache(tmp_path, max_entries=2)
+    keys = [answers.key(day_10, f"{index}", "part1") for index in range(3)]
+    answers.put(keys[0], "a")
+    answers.put(keys[1], "b")
+    os.utime(tmp_path / f"{keys[0]}.json", (0, 0))
+    os.utime(tmp_path / f"{keys[1]}.json", (1, 1))
+    assert answers.get(keys[0]) == "a"  # Refreshes the entry.
+    answers.put(keys[2], "c")
+
+    assert answers.get(keys[1]) is None
+    assert answers.get(keys[0]) == "a"
+    assert answers.get(keys[2]) == "c"
+
+
+def test_runner_serves_repeat_runs_from_cache(tmp_path: Path) -> None:
+    spec = DaySpec(2015, 1)
+    path = spec.input_path(tmp_path / "inputs")
+    path.parent.mkdir(parents=True)
+    path.write_text("()())", encoding="utf-8")
+    answers = AnswerCache(tmp_path / "cache")
+
+    first = runner.run_day(spec, tmp_path / "inputs", cache=answers)
+    second = runner.run_day(spec, tmp_path / "inputs", cache=answers)
+
+    assert first.cached == set()
+    assert second.cached == {1, 2}
+    assert second.answers == first.answers == {1: "-1", 2: "5"}
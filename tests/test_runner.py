@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from solutions import runner
+from solutions.runner import DaySpec
+
+
+def write_input(root: Path, spec: DaySpec, contents: str) -> None:
+    path = spec.input_path(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(contents, encoding="utf-8")
+
+
+def test_discover_filters_years_and_days() -> None:
+    specs = runner.discover([2015], [1, 2, 26])
+    assert specs == [DaySpec(2015, 1), DaySpec(2015, 2)]
+
+
+def test_run_all_reports_answers_and_missing_inputs(tmp_path: Path) -> None:
+    write_input(tmp_path, DaySpec(2015, 1), "()())")
+    write_input(tmp_path, DaySpec(2025, 5), "3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32\n")
+    write_input(tmp_path, DaySpec(2024, 24), "x00: 1\ny00: 0\n\nx00 AND y00 -> z00\n")
+    specs = [DaySpec(2015, 1), DaySpec(2024, 24), DaySpec(2025, 5), DaySpec(2016, 1)]
+
+    results = runner.run_all(specs, tmp_path, workers=2)
+
+    by_spec = {result.spec: result for result in results}
+    assert by_spec[DaySpec(2015, 1)].answers == {1: "-1", 2: "5"}
+    assert by_spec[DaySpec(2025, 5)].answers == {1: "3", 2: "14"}
+    assert by_spec[DaySpec(2024, 24)].answers[1] == "0"
+    assert by_spec[DaySpec(2016, 1)].error.startswith("missing input")
+    assert "2015  01" in runner.format_table(results)
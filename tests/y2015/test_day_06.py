@@ -22,3 +22,20 @@ def test_part2_examples() -> None:
         )
     )
     assert day_06.solve_part2(instructions) == 2_000_001
+
+
+def test_compressed_and_dense_grids_agree() -> None:
+    instructions = day_06.parse(
+        "\n".join(
+            [
+                "turn on 2,1 through 6,3",
+                "toggle 0,0 through 4,9",
+                "turn off 3,2 through 7,2",
+                "turn off 3,2 through 7,2",
+                "toggle 5,0 through 7,9",
+            ]
+        )
+    )
+    for compress in (True, False):
+        assert day_06.solve_part1(instructions, width=8, height=10, compress=compress) == 67
+        assert day_06.solve_part2(instructions, width=8, height=10, compress=compress) == 169
@@ -8,3 +8,12 @@ def test_look_and_say_sequence() -> None:
     sequence = day_10.look_and_say(sequence)
     assert sequence == "21"
     assert day_10.iterate("1", 5) == "312211"
+
+
+def test_element_counts_match_string_lengths() -> None:
+    assert day_10.elements("223") == ["22", "3"]
+    # Everything descended from "1" is built from Conway's 92 common elements.
+    assert len(day_10.Decay().closure(day_10.elements(day_10.iterate("1", 8)))) == 92
+    sequence = "1113222113"
+    for times in (0, 1, 5, 20):
+        assert day_10.sequence_length(sequence, times) == len(day_10.iterate(sequence, times))
@@ -6,3 +6,10 @@ def test_presents_thresholds_small_targets() -> None:
     assert day_20.solve_part1(150) == 8
     assert day_20.solve_part2(66) == 4
     assert day_20.solve_part2(100) == 6
+
+
+def test_segment_size_does_not_change_the_answer() -> None:
+    for segment_size in (1, 5, 64):
+        assert day_20.find_min_house(150, 10, delivery_limit=None, segment_size=segment_size) == 8
+        assert day_20.find_min_house(100, 11, delivery_limit=50, segment_size=segment_size) == 6
+        assert day_20.find_min_house(5000, 3, delivery_limit=2, segment_size=segment_size) == 1112
@@ -5,3 +5,8 @@ def test_example_key_indices() -> None:
     salt = day_14.parse("abc")
     assert day_14.solve_part1(salt) == 22728
     assert day_14.solve_part2(salt) == 22551
+
+
+def test_parallel_batches_match_serial_scan() -> None:
+    serial = day_14.nth_key_index("abc", count=10, workers=1)
+    assert day_14.nth_key_index("abc", count=10, batch_size=300, workers=3) == serial
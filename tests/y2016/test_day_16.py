@@ -4,3 +4,19 @@ from solutions.y2016 import day_16
 def test_dragon_curve_example() -> None:
     state = day_16.parse("10000")
     assert day_16.solve(state, 20) == "01100"
+
+
+def test_checksum_matches_materialized_fill() -> None:
+    def reference(state: str, length: int) -> str:
+        data = state
+        while len(data) < length:
+            data = day_16.dragon_curve(data)
+        digits = data[:length]
+        while len(digits) % 2 == 0:
+            digits = "".join("1" if a == b else "0" for a, b in zip(digits[::2], digits[1::2]))
+        return digits
+
+    for state in ("1", "10000", "110010110100"):
+        for length in (1, 12, 20, 96, 272, 1000):
+            assert day_16.solve(state, length) == reference(state, length)
+    assert len(day_16.solve("10000", 17 * 2**40)) == 17
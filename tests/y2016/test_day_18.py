@@ -4,3 +4,22 @@ from solutions.y2016 import day_18
 def test_trap_tile_generation_example() -> None:
     first_row = day_18.parse(".^^.^.^^^^")
     assert day_18.safe_tiles(first_row, 10) == 38
+
+
+def test_trap_rows_short_circuit_repeats() -> None:
+    assert day_18.next_row("..^^.") == ".^^^^"
+    # "^.." dies out after three rows and "^." flips forever; neither may be simulated row by row.
+    assert day_18.safe_tiles("^..", 10**18) == 5 + 3 * (10**18 - 3)
+    assert day_18.safe_tiles("^.", 10**18 + 1) == 10**18 + 1
+
+
+def test_wide_rows_short_circuit_repeats() -> None:
+    first_row = "^" + "." * 63
+    # This row returns to itself after 126 rows; count one cycle by hand.
+    row, cycle = first_row, 0
+    for _ in range(126):
+        cycle += row.count(".")
+        row = day_18.next_row(row)
+    assert row == first_row
+    cycles, extra = divmod(10**12, 126)
+    assert day_18.safe_tiles(first_row, 10**12) == cycles * cycle + day_18.safe_tiles(first_row, extra)
@@ -11,3 +11,23 @@ def test_generator_matches_sample() -> None:
     seeds = day_15.parse(SAMPLE)
     assert day_15.count_matches(*seeds, pairs=5) == 1
     assert day_15.count_matches(*seeds, pairs=1056, multiple_a=4, multiple_b=8) == 1
+
+
+def naive_low_bits(seed: int, factor: int, multiple: int, count: int) -> list[int]:
+    values = []
+    while len(values) < count:
+        seed = seed * factor % day_15.MODULUS
+        if seed % multiple == 0:
+            values.append(seed & 0xFFFF)
+    return values
+
+
+def test_block_size_does_not_change_the_count() -> None:
+    pairs = 100_000
+    for multiple_a, multiple_b in ((1, 1), (4, 8)):
+        stream_a = naive_low_bits(65, day_15.FACTOR_A, multiple_a, pairs)
+        stream_b = naive_low_bits(8921, day_15.FACTOR_B, multiple_b, pairs)
+        expected = sum(a == b for a, b in zip(stream_a, stream_b))
+        for block_size in (97, 4096):
+            counted = day_15.count_matches(65, 8921, pairs, multiple_a, multiple_b, block_size=block_size)
+            assert counted == expected
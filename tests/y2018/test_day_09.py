@@ -21,3 +21,9 @@ def test_part2_example() -> None:
     game = day_09.parse("10 players; last marble is worth 1618 points")
     assert day_09.solve_part2(game) == 74765078
 
+
+def test_circle_table_is_one_slot_per_marble() -> None:
+    table = day_09.circle_table(1_000)
+    assert len(table) == 1_001
+    assert table.itemsize == 4
+    assert day_09.play_game(30, 5807) == 37305
@@ -14,3 +14,8 @@ def test_part2_examples() -> None:
     assert day_14.solve_part2("92510") == 18
     assert day_14.solve_part2("59414") == 2018
 
+
+def test_scoreboard_search_spans_batch_boundaries() -> None:
+    for batch_size in (1, 2, 7):
+        assert day_14.Scoreboard(capacity=4).find(bytes([5, 1, 5, 8, 9]), batch_size) == 9
+    assert day_14.solve_part2("37") == 0
@@ -1,3 +1,5 @@
+import pytest
+
 from solutions.y2024 import day_06
 
 
@@ -19,3 +21,9 @@ def test_day06_parts() -> None:
     guard_map = day_06.parse(RAW_EXAMPLE)
     assert day_06.solve_part1(guard_map) == 41
     assert day_06.solve_part2(guard_map) == 6
+
+
+def test_day06_parallel_obstruction_search(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(day_06, "PARALLEL_MIN_CANDIDATES", 0)
+    guard_map = day_06.parse(RAW_EXAMPLE)
+    assert day_06.solve_part2(guard_map, workers=2) == 6
@@ -23,3 +23,13 @@ def test_day19_part1_sample() -> None:
 def test_day19_part2_sample() -> None:
     patterns, designs = day_19.parse(SAMPLE_INPUT)
     assert day_19.solve_part2(patterns, designs) == 16
+
+
+def test_day19_trie_counts_with_workers() -> None:
+    patterns, designs = day_19.parse(SAMPLE_INPUT)
+    trie = day_19.TowelTrie(patterns)
+    assert [trie.arrangements(design) for design in designs] == [2, 1, 4, 6, 0, 1, 2, 0]
+    counts = day_19.arrangement_counts(patterns, designs, workers=2)
+    assert counts == [2, 1, 4, 6, 0, 1, 2, 0]
+    assert day_19.solve_part1(patterns, designs, counts=counts) == 6
+    assert day_19.solve_part2(patterns, designs, workers=2) == 16
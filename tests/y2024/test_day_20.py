@@ -29,3 +29,13 @@ def test_day20_sample_counts_limit2() -> None:
 def test_day20_sample_limit20_threshold50() -> None:
     grid = day_20.parse(SAMPLE_INPUT)
     assert day_20.count_cheats(grid, cheat_limit=20, min_savings=50) == 285
+
+
+def test_day20_sample_savings_histogram() -> None:
+    grid = day_20.parse(SAMPLE_INPUT)
+    assert day_20.cheat_histogram(grid, cheat_limit=2, min_savings=1) == {
+        2: 14, 4: 14, 6: 2, 8: 4, 10: 2, 12: 3, 20: 1, 36: 1, 38: 1, 40: 1, 64: 1
+    }
+    histogram = day_20.cheat_histogram(grid, cheat_limit=20, min_savings=50)
+    assert histogram[50] == 32 and histogram[76] == 3
+    assert sum(histogram.values()) == 285
@@ -17,3 +17,9 @@ def test_day22_part1_sample() -> None:
 def test_day22_part2_sample() -> None:
     secrets = day_22.parse(SAMPLE_INPUT)
     assert day_22.solve_part2(secrets) == 24
+
+
+def test_day22_batches_share_one_seen_stamp() -> None:
+    secrets = [1, 2, 3, 2024]
+    assert max(day_22.first_sale_totals(secrets, batch_size=1)) == 23
+    assert day_22.first_sale_totals(secrets, batch_size=3) == day_22.first_sale_totals(secrets)
@@ -1,3 +1,5 @@
+import pytest
+
 from solutions.y2024 import day_24
 
 
@@ -78,3 +80,55 @@ def test_day24_part2_actual() -> None:
 
     raw = Path("inputs/y2024/day_24.txt").read_text()
     assert day_24.solve_part2(raw) == "fhc,ggt,hqk,mwh,qhj,z06,z11,z35"
+
+
+def ripple_adder(bits: int, swaps: dict[str, str]) -> str:
+    lines = [f"x{i:02d}: 0" for i in range(bits)] + [f"y{i:02d}: 0" for i in range(bits)] + [""]
+    gates = [("x00", "XOR", "y00", "z00"), ("x00", "AND", "y00", "c00")]
+    for i in range(1, bits):
+        carry = f"c{i - 1:02d}"
+        gates += [
+            (f"x{i:02d}", "XOR", f"y{i:02d}", f"p{i:02d}"),
+            (f"x{i:02d}", "AND", f"y{i:02d}", f"g{i:02d}"),
+            (f"p{i:02d}", "XOR", carry, f"z{i:02d}"),
+            (f"p{i:02d}", "AND", carry, f"t{i:02d}"),
+            (f"g{i:02d}", "OR", f"t{i:02d}", f"c{i:02d}" if i + 1 < bits else f"z{bits:02d}"),
+        ]
+    lines += [f"{a} {op} {b} -> {swaps.get(out, out)}" for a, op, b, out in gates]
+    return "\n".join(lines) + "\n"
+
+
+def test_day24_part2_generated_adder() -> None:
+    pairs = {"z05": "t05", "p09": "g09", "c20": "z20", "z33": "g33"}
+    swaps = {**pairs, **{b: a for a, b in pairs.items()}}
+    raw = ripple_adder(45, swaps)
+    expected = ",".join(sorted(swaps))
+    assert day_24.solve_part2(raw) == expected
+
+    base_values, gates = day_24.parse(raw)
+    assert ",".join(sorted(w for pair in day_24.search_swaps(base_values, gates) for w in pair)) == expected
+    assert day_24.verify_adder(base_values, gates, sorted(pairs.items()))
+    assert not day_24.verify_adder(base_values, gates, [])
+
+
+def test_day24_circuit_swap_rejects_cycles() -> None:
+    base_values, gates = day_24.parse(ripple_adder(4, {}))
+    circuit = day_24.Circuit(base_values, gates)
+    expected = day_24.load_random_additions(circuit, day_24.random.Random(1))
+    assert not day_24.wrong_bits(circuit, expected)
+    # c01 feeds z02, so making z02's gate drive c01 would close a loop.
+    assert not circuit.swap(circuit.slots["c01"], circuit.slots["z02"])
+    assert not day_24.wrong_bits(circuit, expected)
+    assert circuit.swap(circuit.slots["z01"], circuit.slots["t01"])
+    assert day_24.wrong_bits(circuit, expected)
+
+
+def test_day24_swaps_name_undriven_and_unknown_wires() -> None:
+    base_values, gates = day_24.parse(ripple_adder(4, {}))
+    circuit = day_24.Circuit(base_values, gates)
+    with pytest.raises(ValueError, match="x01"):
+        circuit.swap(circuit.slots["x01"], circuit.slots["z02"])
+    with pytest.raises(ValueError, match="q99"):
+        day_24.verify_adder(base_values, gates, [("q99", "z02")])
+    with pytest.raises(ValueError, match="y00"):
+        day_24.verify_adder(base_values, gates, [("z01", "y00")])